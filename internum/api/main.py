@@ -1,8 +1,9 @@
+from datetime import UTC, datetime
 from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -25,6 +26,29 @@ router.include_router(library_router)
 router.include_router(notices_router)
 router.include_router(users_router)
 
+# version() e current_database() não mudam durante a vida do processo.
+_db_info: dict[str, str] = {}
+
+_STATUS_SQL = text('SELECT version(), current_database(), now()')
+
+
+async def _query_db_status(session: AsyncSession):
+    try:
+        result = await session.execute(_STATUS_SQL)
+        status = result.fetchone()
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=f'Database error: {str(e)}',
+        )
+
+    if not status:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail='No data found'
+        )
+
+    return status
+
 
 @router.get(
     '/status',
@@ -36,26 +60,32 @@ router.include_router(users_router)
     tags=['API'],
 )
 async def status_db(session: Session):
-    try:
-        result = await session.execute(
-            select(func.version(), func.current_database(), func.now())
-        )
-        status = result.fetchone()
+    if not _db_info:
+        version, current_db, _ = await _query_db_status(session)
+        _db_info.update(version_db=version, current_db=current_db)
 
-        if status:
-            version, current_db, current_time = status
-            return {
-                'status': 'ok',
-                'version_db': version,
-                'current_db': current_db,
-                'current_time': current_time,
-            }
-        else:
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND, detail='No data found'
-            )
-    except SQLAlchemyError as e:
-        raise HTTPException(
-            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
-            detail=f'Database error: {str(e)}',
-        )
+    return {
+        'status': 'ok',
+        **_db_info,
+        'current_time': datetime.now(UTC),
+    }
+
+
+@router.get(
+    '/status/deep',
+    response_model=Status,
+    responses={
+        HTTPStatus.NOT_FOUND: {'model': ErrorResponse},
+        HTTPStatus.INTERNAL_SERVER_ERROR: {'model': ErrorResponse},
+    },
+    tags=['API'],
+)
+async def status_db_deep(session: Session):
+    version, current_db, current_time = await _query_db_status(session)
+
+    return {
+        'status': 'ok',
+        'version_db': version,
+        'current_db': current_db,
+        'current_time': current_time,
+    }
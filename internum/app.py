@@ -1,13 +1,15 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from internum.api.main import router as main_router
+from internum.core.email import close_email_client
+from internum.core.middleware.cors import PureCORS
 from internum.core.scheduler.scheduler import scheduler, start_scheduler
-from internum.core.settings import Settings
+from internum.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 
 @asynccontextmanager
@@ -15,21 +17,15 @@ async def lifespan(app: FastAPI):
     start_scheduler()
     yield
     scheduler.shutdown()
+    await close_email_client()
 
 
-app = FastAPI(title='Internum API - 1 RI Cascavel', lifespan=lifespan)
-
-
-origins = [
-    settings.FRONTEND_URL,
-]
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=['*'],
-    allow_headers=['*'],
+app = FastAPI(
+    title='Internum API - 1 RI Cascavel',
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+app.add_middleware(PureCORS, origin=settings.FRONTEND_URL)
+
 app.include_router(main_router)
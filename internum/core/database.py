@@ -1,17 +1,63 @@
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     async_sessionmaker,
     create_async_engine,
 )
 
-from internum.core.settings import Settings
+from internum.core.settings import get_settings
+
+settings = get_settings()
+
+# Cada worker pode abrir até POOL_SIZE + MAX_OVERFLOW conexões; o
+# max_connections do Postgres deve comportar esse total por worker.
+# O cache de compilação cobre as combinações de filtro/ordenação das
+# listagens; o pool padrão do engine async já é o AsyncAdaptedQueuePool.
+# Atrás do PgBouncer em modo transaction não há prepared statements no
+# servidor: os caches do asyncpg e do dialeto precisam ficar desligados.
+connect_args = {'server_settings': {'timezone': 'UTC'}}
+if settings.PGBOUNCER_TRANSACTION_MODE:
+    connect_args['statement_cache_size'] = 0
+    connect_args['prepared_statement_cache_size'] = 0
 
 engine = create_async_engine(
-    Settings().DATABASE_URL, connect_args={'options': '-c timezone=UTC'}
+    settings.DATABASE_URL,
+    connect_args=connect_args,
+    pool_size=settings.SQLALCHEMY_POOL_SIZE,
+    max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
+    pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
+    pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=settings.SQLALCHEMY_QUERY_CACHE_SIZE,
+)
+
+# Sem autoflush: as rotas só escrevem no commit; onde uma consulta precisa
+# ver alterações pendentes, o flush é explícito (ex.: jobs noturnos).
+async_session_maker = async_sessionmaker(
+    engine, expire_on_commit=False, autoflush=False
 )
 
-async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+def make_read_session_maker(bind: AsyncEngine):
+    """Sessões de leitura em AUTOCOMMIT, sem as idas de BEGIN/COMMIT.
+
+    A conexão continua com a sessão até ela ser fechada, ao fim da
+    requisição; só as transações explícitas deixam de existir.
+    """
+    return async_sessionmaker(
+        bind.execution_options(isolation_level='AUTOCOMMIT'),
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+
+async_read_session_maker = make_read_session_maker(engine)
 
 
 async def get_session():  # pragma: no cover
     async with async_session_maker() as session:
         yield session
+
+
+async def get_read_session():  # pragma: no cover
+    async with async_read_session_maker() as session:
+        yield session
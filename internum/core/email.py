@@ -1,19 +1,39 @@
-import mailtrap as mt
+import httpx
 
-from internum.core.settings import Settings
+from internum.core.settings import get_settings
 
-settings = Settings()
+MAILTRAP_SEND_URL = 'https://send.api.mailtrap.io/api/send'
+
+SENDER = {
+    'email': 'internum@marconnora.com',
+    'name': 'Internum - [1º SRI de Cascavel/PR]',
+}
+
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    # Criado no primeiro envio, já dentro do event loop que vai usá-lo.
+    global _client  # noqa: PLW0603
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=10.0)
+    return _client
+
+
+async def close_email_client():
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 class EmailService:
-    def __init__(self, token: str = settings.MAILTRAP_TOKEN):
-        self.client = mt.MailtrapClient(token=token)
-        self.sender = mt.Address(
-            email='internum@marconnora.com',
-            name='Internum - [1º SRI de Cascavel/PR]',
-        )
+    def __init__(self, token: str | None = None):
+        token = token or get_settings().MAILTRAP_TOKEN
+        self.headers = {'Authorization': f'Bearer {token}'}
+        self.sender = SENDER
 
-    def send_email(
+    async def send_email(
         self,
         email_to: list[str],
         subject: str,
@@ -21,16 +41,20 @@ class EmailService:
         html: str = None,
         category: str = 'General',
     ):
-        recipients = [mt.Address(email=email) for email in email_to]
-
-        mail = mt.Mail(
-            sender=self.sender,
-            to=recipients,
-            subject=subject,
-            text=text,
-            html=html,
-            category=category,
-        )
+        mail = {
+            'from': self.sender,
+            'to': [{'email': email} for email in email_to],
+            'subject': subject,
+            'category': category,
+        }
 
-        response = self.client.send(mail)
-        return response
+        if text:
+            mail['text'] = text
+        if html:
+            mail['html'] = html
+
+        response = await _get_client().post(
+            MAILTRAP_SEND_URL, json=mail, headers=self.headers
+        )
+        response.raise_for_status()
+        return response.json()
@@ -0,0 +1,89 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALLOW_METHODS = b'DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT'
+PREFLIGHT_MAX_AGE = b'600'
+
+
+class PureCORS:
+    """Middleware ASGI de CORS para uma única origem com credenciais."""
+
+    def __init__(self, app: ASGIApp, origin: str):
+        self.app = app
+        self.origin = origin.encode('latin-1')
+        self.simple_headers = (
+            (b'access-control-allow-origin', self.origin),
+            (b'access-control-allow-credentials', b'true'),
+            (b'vary', b'Origin'),
+        )
+        self.preflight_headers = (
+            *self.simple_headers,
+            (b'access-control-allow-methods', ALLOW_METHODS),
+            (b'access-control-max-age', PREFLIGHT_MAX_AGE),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope['headers']:
+            if name == b'origin':
+                origin = value
+            elif name == b'access-control-request-method':
+                request_method = value
+            elif name == b'access-control-request-headers':
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope['method'] == 'OPTIONS' and request_method is not None:
+            await self._preflight(origin, request_headers, send)
+            return
+
+        if origin != self.origin:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message):
+            if message['type'] == 'http.response.start':
+                message['headers'] = [
+                    *message.get('headers', ()),
+                    *self.simple_headers,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self, origin: bytes, request_headers: bytes | None, send: Send
+    ):
+        if origin != self.origin:
+            await send({
+                'type': 'http.response.start',
+                'status': 400,
+                'headers': [(b'content-type', b'text/plain; charset=utf-8')],
+            })
+            await send({
+                'type': 'http.response.body',
+                'body': b'Disallowed CORS origin',
+            })
+            return
+
+        headers = self.preflight_headers
+        if request_headers:
+            headers = (
+                *headers,
+                (b'access-control-allow-headers', request_headers),
+            )
+
+        await send({
+            'type': 'http.response.start',
+            'status': 204,
+            'headers': headers,
+        })
+        await send({'type': 'http.response.body', 'body': b''})
@@ -0,0 +1,40 @@
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import ARRAY, Integer, any_, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from internum.modules.users.models import User
+
+AUDIT_RELATIONS = ('created_by', 'updated_by', 'deleted_by')
+
+
+async def load_audit_users(
+    session: AsyncSession,
+    objs: Iterable,
+    relations: Sequence[str] = AUDIT_RELATIONS,
+):
+    """Preenche os usuários relacionados de vários objetos em uma consulta.
+
+    Cada relação em ``relations`` deve ter a chave estrangeira ``<nome>_id``;
+    objetos que não possuem a relação são ignorados.
+    """
+    pairs = []
+    for obj in objs:
+        for relation in relations:
+            if hasattr(type(obj), relation):
+                pairs.append((obj, relation, getattr(obj, f'{relation}_id')))
+
+    user_ids = {user_id for _, _, user_id in pairs if user_id is not None}
+    users = {}
+    if user_ids:
+        # Um único parâmetro ARRAY: o SQL é o mesmo para qualquer número
+        # de ids, e o asyncpg reaproveita o statement preparado.
+        ids_param = bindparam('user_ids', list(user_ids), type_=ARRAY(Integer))
+        result = await session.scalars(
+            select(User).where(User.id == any_(ids_param))
+        )
+        users = {user.id: user for user in result}
+
+    for obj, relation, user_id in pairs:
+        set_committed_value(obj, relation, users.get(user_id))
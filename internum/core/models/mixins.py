@@ -63,7 +63,7 @@ class AuditMixin:
         return relationship(
             'User',
             foreign_keys=[cls.created_by_id],
-            lazy='joined',
+            lazy='raise_on_sql',
             init=False,
         )
 
@@ -72,7 +72,7 @@ class AuditMixin:
         return relationship(
             'User',
             foreign_keys=[cls.updated_by_id],
-            lazy='joined',
+            lazy='raise_on_sql',
             init=False,
         )
 
@@ -81,7 +81,7 @@ class AuditMixin:
         return relationship(
             'User',
             foreign_keys=[cls.deleted_by_id],
-            lazy='joined',
+            lazy='raise_on_sql',
             init=False,
         )
 
@@ -1,3 +1,12 @@
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import registry
 
 table_registry = registry()
+
+# Índices trigram (gin_trgm_ops) dependem da extensão; ela é criada antes
+# de qualquer tabela do metadata.
+event.listen(
+    table_registry.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm'),
+)
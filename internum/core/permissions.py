@@ -3,41 +3,49 @@ from typing import Annotated, Callable
 
 from fastapi import Depends, HTTPException
 
-from internum.core.security import get_current_user
+from internum.core.security import get_current_read_user, get_current_user
 from internum.modules.users.schemas import UserRead
 
 CurrentUser = Annotated[UserRead, Depends(get_current_user)]
+# Para rotas com ReadSession: a autenticação usa a mesma conexão da rota.
+CurrentReadUser = Annotated[UserRead, Depends(get_current_read_user)]
+
+_FORBIDDEN_DETAIL = 'Acesso negado: usuário sem permissão'
 
 
 def require_self_or_roles(*allowed_roles: str) -> Callable:
-    def dependency(
+    allowed = frozenset(allowed_roles)
+
+    async def dependency(
         current_user: CurrentUser,
         user_id: int,
     ) -> UserRead:
         if current_user.id == user_id:
             return current_user
 
-        if current_user.role in allowed_roles:
+        if current_user.role in allowed:
             return current_user
 
         raise HTTPException(
-            status_code=HTTPStatus.FORBIDDEN,
-            detail='Acesso negado: usuário sem permissão',
+            status_code=HTTPStatus.FORBIDDEN, detail=_FORBIDDEN_DETAIL
         )
 
     return dependency
 
 
-def require_roles(*allowed_roles: str) -> Callable:
-    def dependency(
-        current_user: CurrentUser,
+def require_roles(
+    *allowed_roles: str, user_dependency: Callable = get_current_user
+) -> Callable:
+    allowed = frozenset(allowed_roles)
+
+    async def dependency(
+        current_user: Annotated[UserRead, Depends(user_dependency)],
     ):
-        if current_user.role in allowed_roles:
+        if current_user.role in allowed:
             return current_user
 
         raise HTTPException(
-            status_code=HTTPStatus.FORBIDDEN,
-            detail='Acesso negado: usuário sem permissão',
+            status_code=HTTPStatus.FORBIDDEN, detail=_FORBIDDEN_DETAIL
         )
 
     return dependency
@@ -50,4 +58,10 @@ VerifySelfAdminCoord = Annotated[
 VerifyAdminCoord = Annotated[
     UserRead, Depends(require_roles('admin', 'coord'))
 ]
+VerifyAdminCoordRead = Annotated[
+    UserRead,
+    Depends(
+        require_roles('admin', 'coord', user_dependency=get_current_read_user)
+    ),
+]
 VerifyAdmin = Annotated[UserRead, Depends(require_roles('admin'))]
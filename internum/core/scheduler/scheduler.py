@@ -3,27 +3,46 @@ from zoneinfo import ZoneInfo
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from internum.core.database import async_session_maker
 from internum.modules.auth.jobs import delete_expired_reset_tokens
-from internum.modules.library.jobs import check_overdue_loans
+from internum.modules.library.jobs import (
+    mark_overdue_loans,
+    send_late_loan_alerts,
+)
 
 scheduler = AsyncIOScheduler()
 
 
+async def nightly_housekeeping():
+    """Executa as rotinas diárias em uma única sessão e transação.
+
+    Os emails de atraso só saem depois do commit, com a sessão já fechada:
+    cada lote é carregado em uma sessão curta e enviado após fechá-la.
+    """
+    async with async_session_maker() as session:
+        try:
+            late_loan_ids = await mark_overdue_loans(session)
+            await delete_expired_reset_tokens(session)
+            await session.commit()
+        except Exception as e:
+            print(f'[Scheduler] Erro na rotina diária: {e}')
+            await session.rollback()
+            return
+
+    try:
+        await send_late_loan_alerts(async_session_maker, late_loan_ids)
+    except Exception as e:
+        print(f'[Scheduler] Erro ao enviar avisos de atraso: {e}')
+
+
 def start_scheduler():
     timezone_sp = ZoneInfo('America/Sao_Paulo')
 
     scheduler.add_job(
-        check_overdue_loans,
-        CronTrigger(hour=00, minute=00, timezone=timezone_sp),
-        id='check_overdue_loans',
-        name='Verificar empréstimos vencidos',
-    )
-
-    scheduler.add_job(
-        delete_expired_reset_tokens,
+        nightly_housekeeping,
         CronTrigger(hour=00, minute=00, timezone=timezone_sp),
-        id='delete_expired_tokens',
-        name='Deletar tokens expirados',
+        id='nightly_housekeeping',
+        name='Verificar empréstimos vencidos e deletar tokens expirados',
     )
 
     scheduler.start()
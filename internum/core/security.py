@@ -1,7 +1,9 @@
+import asyncio
+import hashlib
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
-from zoneinfo import ZoneInfo
 
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
@@ -12,23 +14,44 @@ from jwt import (
     decode,
     encode,
 )
+from jwt.algorithms import get_default_algorithms
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
-from internum.core.database import get_session
-from internum.core.settings import Settings
+from internum.core.database import get_read_session, get_session
+from internum.core.settings import get_settings
 from internum.modules.users.models import User
 
-settings = Settings()
-pwd_context = PasswordHash.recommended()
+settings = get_settings()
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+# Chave convertida uma única vez; o PyJWT aceita a chave já preparada.
+_JWT_KEY = get_default_algorithms()[ALGORITHM].prepare_key(SECRET_KEY)
+_JWT_ALGORITHMS = [ALGORITHM]
+_UTC = timezone.utc
+# Argon2id com os parâmetros recomendados pela OWASP (46 MiB, t=2, p=1).
+# Hashes antigos continuam válidos: os parâmetros ficam gravados no hash.
+pwd_context = PasswordHash((
+    Argon2Hasher(time_cost=2, memory_cost=47_104, parallelism=1),
+))
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl='api/v1/auth/token', refreshUrl='api/v1/auth/refresh_token'
 )
 
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAXSIZE = 10_000
 
-def _now_utc() -> datetime:
-    return datetime.now(tz=ZoneInfo('UTC'))
+# token -> (expira_em, valores das colunas do usuário)
+#
+# O cache é por processo. invalidate_user_cache só limpa o worker que
+# atendeu a alteração; nos demais, a desativação, a troca de papel ou de
+# senha vale em até USER_CACHE_TTL_SECONDS. Essa janela é aceita: quem
+# precisar de efeito imediato em todos os workers deve baixar o TTL.
+_user_cache: dict[str, tuple[float, dict]] = {}
 
 
 def create_access_token(
@@ -37,15 +60,13 @@ def create_access_token(
     purpose: str | None = None,
 ):
     to_encode = data.copy()
-    expire = _now_utc() + timedelta(minutes=expire_minutes)
+    expire = datetime.now(_UTC) + timedelta(minutes=expire_minutes)
     to_encode.update({'exp': expire})
 
     if purpose:
         to_encode['purpose'] = purpose
 
-    encoded_jwt = encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    encoded_jwt = encode(to_encode, _JWT_KEY, algorithm=ALGORITHM)
 
     return encoded_jwt
 
@@ -55,28 +76,38 @@ def create_refresh_token(
 ):
     to_encode = data.copy()
     jti = uuid.uuid4().hex
-    expire = _now_utc() + timedelta(expire_minutes)
+    expire = datetime.now(_UTC) + timedelta(expire_minutes)
 
     to_encode.update({'exp': expire, 'jti': jti, 'type': 'refresh'})
-    encoded_jwt = encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    encoded_jwt = encode(to_encode, _JWT_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def get_password_hash(password: str):
-    return pwd_context.hash(password)
+# O hash de senha consome CPU por dezenas de milissegundos; roda em uma
+# thread para não bloquear o event loop.
+async def get_password_hash(password: str):
+    return await asyncio.to_thread(pwd_context.hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str):
+    return await asyncio.to_thread(
+        pwd_context.verify, plain_password, hashed_password
+    )
+
+
+# Hash usado quando o usuário não existe, para que o login leve o mesmo
+# tempo e não revele quais usernames estão cadastrados.
+DUMMY_PASSWORD_HASH = pwd_context.hash(uuid.uuid4().hex)
 
 
-def verify_password(plain_password: str, hashed_password: str):
-    return pwd_context.verify(plain_password, hashed_password)
+def hash_token(token: str) -> str:
+    """Digest SHA-256 (hex) de um token, para guardar e buscar no banco."""
+    return hashlib.sha256(token.encode()).hexdigest()
 
 
 def decode_token(token: str, expected_purpose: str | None = None):
     try:
-        payload = decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
 
         if expected_purpose is not None:
             token_purpose = payload.get('purpose')
@@ -94,10 +125,54 @@ def decode_token(token: str, expected_purpose: str | None = None):
         )
 
 
-async def get_current_user(
-    session: AsyncSession = Depends(get_session),
-    token: str = Depends(oauth2_scheme),
-):
+def _cache_user(token: str, user: User, token_exp: float):
+    if len(_user_cache) >= USER_CACHE_MAXSIZE:
+        _user_cache.pop(next(iter(_user_cache)))
+
+    expires_at = min(time.time() + USER_CACHE_TTL_SECONDS, token_exp)
+    _user_cache[token] = (
+        expires_at,
+        {
+            attr.key: getattr(user, attr.key)
+            for attr in User.__mapper__.column_attrs
+        },
+    )
+
+
+async def _get_cached_user(session: AsyncSession, token: str) -> User | None:
+    entry = _user_cache.get(token)
+    if entry is None:
+        return None
+
+    expires_at, values = entry
+    if expires_at <= time.time():
+        _user_cache.pop(token, None)
+        return None
+
+    user = User.__mapper__.class_manager.new_instance()
+    for key, value in values.items():
+        set_committed_value(user, key, value)
+    make_transient_to_detached(user)
+
+    return await session.merge(user, load=False)
+
+
+def invalidate_user_cache(user_id: int):
+    """Remove do cache os tokens do usuário após alterações nos dados.
+
+    Vale só para este processo; os outros workers expiram a entrada em até
+    USER_CACHE_TTL_SECONDS.
+    """
+    for token, (_, values) in list(_user_cache.items()):
+        if values['id'] == user_id:
+            _user_cache.pop(token, None)
+
+
+async def _authenticate(session: AsyncSession, token: str):
+    cached_user = await _get_cached_user(session, token)
+    if cached_user is not None:
+        return cached_user
+
     credentials_exception = HTTPException(
         status_code=HTTPStatus.UNAUTHORIZED,
         detail='Não foi possível validar as credenciais',
@@ -105,9 +180,7 @@ async def get_current_user(
     )
 
     try:
-        payload = decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         subject_username = payload.get('sub')
 
         if not subject_username:
@@ -132,4 +205,25 @@ async def get_current_user(
             detail=f'Não encontrado usuário com id ({user.id}).',
         )
 
+    _cache_user(token, user, payload['exp'])
+
     return user
+
+
+async def get_current_user(
+    session: AsyncSession = Depends(get_session),
+    token: str = Depends(oauth2_scheme),
+):
+    return await _authenticate(session, token)
+
+
+async def get_current_read_user(
+    session: AsyncSession = Depends(get_read_session),
+    token: str = Depends(oauth2_scheme),
+):
+    """Autentica pela sessão de leitura da própria rota.
+
+    O FastAPI reaproveita a dependência na requisição: a rota e a
+    autenticação dividem a mesma conexão.
+    """
+    return await _authenticate(session, token)
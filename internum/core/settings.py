@@ -1,9 +1,15 @@
+from datetime import date
+from functools import lru_cache
+
+from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
-        env_file='.env.development', env_file_encoding='utf-8'
+        env_file='.env.development',
+        env_file_encoding='utf-8',
+        extra='ignore',
     )
 
     SECRET_KEY: str
@@ -15,7 +21,12 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_DB: str
     POSTGRES_PASSWORD: str
-    DATABASE_URL: str = ''
+    SQLALCHEMY_POOL_SIZE: int = 20
+    SQLALCHEMY_MAX_OVERFLOW: int = 40
+    SQLALCHEMY_POOL_RECYCLE: int = 1800
+    SQLALCHEMY_POOL_TIMEOUT: int = 30
+    PGBOUNCER_TRANSACTION_MODE: bool = False
+    SQLALCHEMY_QUERY_CACHE_SIZE: int = 1200
     REFRESH_COOKIE_NAME: str
     REFRESH_COOKIE_PATH: str
     REFRESH_TOKEN_EXPIRE_DAYS: int
@@ -27,9 +38,19 @@ class Settings(BaseSettings):
     ADMIN_USERNAME: str
     ADMIN_EMAIL: str
     ADMIN_PASSWORD: str
-    ADMIN_BIRTHDAY: str
+    ADMIN_BIRTHDAY: date
     MAILTRAP_TOKEN: str
 
-    def __init__(self, **values):
-        super().__init__(**values)
-        self.DATABASE_URL = f'postgresql+psycopg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}'
+    @computed_field
+    @property
+    def DATABASE_URL(self) -> str:
+        return (
+            'postgresql+asyncpg://'
+            f'{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}'
+            f'@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}'
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
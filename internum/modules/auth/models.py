@@ -1,6 +1,6 @@
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from internum.core.models.registry import table_registry
@@ -9,11 +9,22 @@ from internum.core.models.registry import table_registry
 @table_registry.mapped_as_dataclass
 class PasswordResetToken:
     __tablename__ = 'password_reset_tokens'
+    __table_args__ = (
+        # Atende a limpeza noturna dos tokens já usados.
+        Index(
+            'ix_password_reset_tokens_used',
+            'expires_at',
+            postgresql_where=text('used IS TRUE'),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
-    token: Mapped[str] = mapped_column(String, unique=True, nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    # SHA-256 (hex) do JWT; o token em si nunca é gravado.
+    token: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), index=True
+    )
     used: Mapped[bool] = mapped_column(Boolean, default=False)
 
     def is_expired(self):
@@ -1,5 +1,6 @@
 from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
+from string import Template
 from typing import Annotated, Optional
 from zoneinfo import ZoneInfo
 
@@ -19,13 +20,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from internum.core.database import get_session
 from internum.core.email import EmailService
 from internum.core.security import (
+    DUMMY_PASSWORD_HASH,
     create_access_token,
     create_refresh_token,
     decode_token,
     get_password_hash,
+    hash_token,
+    invalidate_user_cache,
     verify_password,
 )
-from internum.core.settings import Settings
+from internum.core.settings import get_settings
 from internum.modules.auth.models import PasswordResetToken
 from internum.modules.auth.schemas import (
     ForgotPasswordRequest,
@@ -40,9 +44,83 @@ router = APIRouter(prefix='/auth', tags=['Auth'])
 OAuth2Form = Annotated[OAuth2PasswordRequestForm, Depends()]
 Session = Annotated[AsyncSession, Depends(get_session)]
 
-settings = Settings()
+settings = get_settings()
 email_service = EmailService()
 
+# Argumentos do cookie de refresh, montados uma vez na importação.
+_REFRESH_COOKIE_NAME = settings.REFRESH_COOKIE_NAME
+_DELETE_COOKIE_KW = {
+    'key': _REFRESH_COOKIE_NAME,
+    'path': settings.REFRESH_COOKIE_PATH,
+    'domain': None,
+    'secure': settings.SECURE_COOKIE,
+    'httponly': True,
+    'samesite': settings.REFRESH_COOKIE_SAMESITE,
+}
+_SET_COOKIE_KW = {
+    **_DELETE_COOKIE_KW,
+    'max_age': settings.REFRESH_COOKIE_MAX_AGE,
+    'expires': settings.REFRESH_COOKIE_MAX_AGE,
+}
+
+_SP_TZ = ZoneInfo('America/Sao_Paulo')
+
+_RESET_EMAIL_TMPL = Template("""
+<table width="100%" cellpadding="0" cellspacing="0" style="background-color:#f8f9fa;padding:40px 0;">
+  <tr>
+    <td align="center">
+      <table width="100%" cellpadding="0" cellspacing="0" style="max-width:520px;background:white;border-radius:8px;padding:32px;font-family:Arial,Helvetica,sans-serif;box-shadow:0 2px 8px rgba(0,0,0,0.05);">
+
+        <tr>
+          <td style="font-size:20px;font-weight:bold;color:#0d6efd;padding-bottom:12px;text-align:center;">
+            Recuperação de Senha
+          </td>
+        </tr>
+
+        <tr>
+          <td style="font-size:15px;color:#333;padding-bottom:20px;line-height:1.5;">
+            Você solicitou a redefinição de senha da sua conta no <strong>Internum</strong>. 
+            Clique no botão abaixo para criar uma nova senha.
+          </td>
+        </tr>
+
+        <tr>
+          <td align="center" style="padding-bottom:28px;">
+            <a href="$reset_link"
+               style="
+                  background-color:#0d6efd;
+                  color:white;
+                  text-decoration:none;
+                  padding:12px 22px;
+                  border-radius:6px;
+                  font-size:15px;
+                  font-weight:bold;
+                  display:inline-block;
+               ">
+              Redefinir Senha
+            </a>
+          </td>
+        </tr>
+
+        <tr>
+          <td style="font-size:14px;color:#555;line-height:1.5;padding-bottom:20px;">
+            Por segurança, este link expira em <strong>$expire_minutes minutos</strong> após a requisição realizada em $requested.<br>
+            Caso você não tenha solicitado essa alteração, basta ignorar este e-mail.
+          </td>
+        </tr>
+
+        <tr>
+          <td style="font-size:12px;color:#999;text-align:center;padding-top:10px;">
+            Internum — 1º SRI de Cascavel/PR
+          </td>
+        </tr>
+
+      </table>
+    </td>
+  </tr>
+</table>
+""")  # noqa: E501, W291
+
 
 @router.post('/token', response_model=Token)
 async def login_for_access_token(
@@ -54,13 +132,11 @@ async def login_for_access_token(
         select(User).where(User.username == form_data.username)
     )
 
-    if not user or not user.active:
-        raise HTTPException(
-            status_code=HTTPStatus.UNAUTHORIZED,
-            detail='Email ou senha incorretos',
-        )
+    password_ok = await verify_password(
+        form_data.password, user.password if user else DUMMY_PASSWORD_HASH
+    )
 
-    if not verify_password(form_data.password, user.password):
+    if not user or not user.active or not password_ok:
         raise HTTPException(
             status_code=HTTPStatus.UNAUTHORIZED,
             detail='Email ou senha incorretos',
@@ -69,16 +145,7 @@ async def login_for_access_token(
     access_token = create_access_token(data={'sub': user.username})
     refresh_token = create_refresh_token(data={'sub': user.username})
 
-    response.set_cookie(
-        key=settings.REFRESH_COOKIE_NAME,
-        value=refresh_token,
-        httponly=True,
-        secure=settings.SECURE_COOKIE,
-        samesite=settings.REFRESH_COOKIE_SAMESITE,
-        max_age=settings.REFRESH_COOKIE_MAX_AGE,
-        expires=settings.REFRESH_COOKIE_MAX_AGE,
-        path=settings.REFRESH_COOKIE_PATH,
-    )
+    response.set_cookie(value=refresh_token, **_SET_COOKIE_KW)
     return {'access_token': access_token, 'token_type': 'bearer'}
 
 
@@ -86,9 +153,7 @@ async def login_for_access_token(
 async def refresh_access_token(
     request: Request, response: Response, session: Session
 ):
-    refresh_token: Optional[str] = request.cookies.get(
-        settings.REFRESH_COOKIE_NAME
-    )
+    refresh_token: Optional[str] = request.cookies.get(_REFRESH_COOKIE_NAME)
 
     if not refresh_token:
         raise HTTPException(
@@ -128,14 +193,7 @@ async def refresh_access_token(
 
 @router.post('/logout', status_code=HTTPStatus.NO_CONTENT)
 async def logout(response: Response):
-    response.delete_cookie(
-        key=settings.REFRESH_COOKIE_NAME,
-        path=settings.REFRESH_COOKIE_PATH,
-        domain=None,
-        secure=settings.SECURE_COOKIE,
-        httponly=True,
-        samesite=settings.REFRESH_COOKIE_SAMESITE,
-    )
+    response.delete_cookie(**_DELETE_COOKIE_KW)
 
 
 @router.post(
@@ -162,10 +220,11 @@ async def forgot_password(
         purpose='password_reset',
     )
 
+    now = datetime.now(UTC)
     db_reset_token = PasswordResetToken(
         user_id=user.id,
-        token=reset_token,
-        expires_at=datetime.now(UTC)
+        token=hash_token(reset_token),
+        expires_at=now
         + timedelta(minutes=settings.RESET_TOKEN_EXPIRE_MINUTES),
     )
 
@@ -176,67 +235,13 @@ async def forgot_password(
         settings.FRONTEND_URL + '/auth/reset-password?token=' + reset_token
     )
 
-    requested = (
-        datetime.now(UTC)
-        .astimezone(ZoneInfo('America/Sao_Paulo'))
-        .strftime('%d/%m/%Y %H:%M:%S')
-    )
-
-    html_content = f"""
-<table width="100%" cellpadding="0" cellspacing="0" style="background-color:#f8f9fa;padding:40px 0;">
-  <tr>
-    <td align="center">
-      <table width="100%" cellpadding="0" cellspacing="0" style="max-width:520px;background:white;border-radius:8px;padding:32px;font-family:Arial,Helvetica,sans-serif;box-shadow:0 2px 8px rgba(0,0,0,0.05);">
-
-        <tr>
-          <td style="font-size:20px;font-weight:bold;color:#0d6efd;padding-bottom:12px;text-align:center;">
-            Recuperação de Senha
-          </td>
-        </tr>
-
-        <tr>
-          <td style="font-size:15px;color:#333;padding-bottom:20px;line-height:1.5;">
-            Você solicitou a redefinição de senha da sua conta no <strong>Internum</strong>. 
-            Clique no botão abaixo para criar uma nova senha.
-          </td>
-        </tr>
+    requested = now.astimezone(_SP_TZ).strftime('%d/%m/%Y %H:%M:%S')
 
-        <tr>
-          <td align="center" style="padding-bottom:28px;">
-            <a href="{reset_link}"
-               style="
-                  background-color:#0d6efd;
-                  color:white;
-                  text-decoration:none;
-                  padding:12px 22px;
-                  border-radius:6px;
-                  font-size:15px;
-                  font-weight:bold;
-                  display:inline-block;
-               ">
-              Redefinir Senha
-            </a>
-          </td>
-        </tr>
-
-        <tr>
-          <td style="font-size:14px;color:#555;line-height:1.5;padding-bottom:20px;">
-            Por segurança, este link expira em <strong>{settings.RESET_TOKEN_EXPIRE_MINUTES} minutos</strong> após a requisição realizada em {requested}.<br>
-            Caso você não tenha solicitado essa alteração, basta ignorar este e-mail.
-          </td>
-        </tr>
-
-        <tr>
-          <td style="font-size:12px;color:#999;text-align:center;padding-top:10px;">
-            Internum — 1º SRI de Cascavel/PR
-          </td>
-        </tr>
-
-      </table>
-    </td>
-  </tr>
-</table>
-"""  # noqa: E501, W291
+    html_content = _RESET_EMAIL_TMPL.substitute(
+        reset_link=reset_link,
+        expire_minutes=settings.RESET_TOKEN_EXPIRE_MINUTES,
+        requested=requested,
+    )
 
     background_tasks.add_task(
         email_service.send_email,
@@ -275,18 +280,23 @@ async def reset_password(data: ResetPasswordRequest, session: Session):
             status_code=HTTPStatus.BAD_REQUEST, detail='Token inválido.'
         )
 
-    db_token = await session.scalar(
-        select(PasswordResetToken).where(
-            PasswordResetToken.token == data.token
+    # Token e usuário (do 'sub') em uma única ida ao banco.
+    row = (
+        await session.execute(
+            select(PasswordResetToken, User)
+            .outerjoin(User, User.id == int(user_id))
+            .where(PasswordResetToken.token == hash_token(data.token))
         )
-    )
+    ).first()
 
-    if not db_token:
+    if not row:
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
             detail='Token inválido.',
         )
 
+    db_token, db_user = row
+
     if db_token.used:
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
@@ -294,21 +304,20 @@ async def reset_password(data: ResetPasswordRequest, session: Session):
             'Solicite um novo.',
         )
 
-    db_user = await session.scalar(select(User).where(User.id == int(user_id)))
-
     if not db_user:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail='Usuário não encontrado.'
         )
 
-    if verify_password(data.new_password, db_user.password):
+    if await verify_password(data.new_password, db_user.password):
         raise HTTPException(
             status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
             detail='A nova senha não pode ser igual a anterior.',
         )
 
-    db_user.password = get_password_hash(data.new_password)
+    db_user.password = await get_password_hash(data.new_password)
     db_token.used = True
     await session.commit()
+    invalidate_user_cache(db_user.id)
 
     return {'message': 'Senha redefinida com sucesso.'}
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class BirthdayUser(BaseModel):
@@ -57,3 +57,9 @@ class HomeSummary(BaseModel):
     legal_brief: Optional[LegalBriefRandom] = None
     unread_notices: UnreadNoticesSummary
     loans: list[LoansByUser]
+
+
+# Validadores de lista montados uma vez, reaproveitados a cada requisição.
+BIRTHDAY_LIST_ADAPTER = TypeAdapter(list[BirthdayUser])
+UNREAD_NOTICE_LIST_ADAPTER = TypeAdapter(list[UnreadNotice])
+LOANS_LIST_ADAPTER = TypeAdapter(list[LoansByUser])
@@ -1,26 +1,52 @@
 from datetime import date, datetime
+from functools import cached_property
 from typing import Annotated, Sequence
 
 from fastapi import Depends
-from sqlalchemy import extract, func, select
+from sqlalchemy import and_, extract, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
 from internum.core.database import get_session
-from internum.modules.home.schemas import HomeSummary, UnreadNoticesSummary
+from internum.modules.home.schemas import (
+    BIRTHDAY_LIST_ADAPTER,
+    LOANS_LIST_ADAPTER,
+    UNREAD_NOTICE_LIST_ADAPTER,
+    HomeSummary,
+    LegalBriefRandom,
+    UnreadNoticesSummary,
+)
 from internum.modules.legal_briefs.models import LegalBrief
-from internum.modules.library.models import Loan
-from internum.modules.library.schemas import LoanStatus
+from internum.modules.library.enums import LoanStatus
+from internum.modules.library.models import Book, Loan
 from internum.modules.notices.models import Notice, NoticeRead
 from internum.modules.users.models import User
 
 Session = Annotated[AsyncSession, Depends(get_session)]
 
+MONTHS_PT = (
+    'janeiro',
+    'fevereiro',
+    'março',
+    'abril',
+    'maio',
+    'junho',
+    'julho',
+    'agosto',
+    'setembro',
+    'outubro',
+    'novembro',
+    'dezembro',
+)
+
 
 class HomeService:
     def __init__(self, session: Session):
         self.session = session
-        self.today = date.today()
+
+    @cached_property
+    def today(self) -> date:
+        return date.today()
 
     async def _get_monthly_birthdays(self):
         return (
@@ -32,47 +58,63 @@ class HomeService:
         ).all()
 
     async def _get_random_legal_brief(self):
+        # Sorteia um id até o maior existente e busca o primeiro >= a ele
+        # pelo índice, evitando ordenar a tabela inteira por random().
+        not_canceled = LegalBrief.canceled.is_(False)
+        random_id = (
+            select(func.floor(func.random() * func.max(LegalBrief.id)))
+            .where(not_canceled)
+            .scalar_subquery()
+        )
+
         return await self.session.scalar(
             select(LegalBrief)
-            .where(LegalBrief.canceled.is_(False))
-            .order_by(func.random())
+            .where(not_canceled, LegalBrief.id >= random_id)
+            .order_by(LegalBrief.id)
             .limit(1)
         )
 
     async def _get_unread_notices_summary(
         self, current_user_id: int, user_created_at: datetime
     ):
-        created_after_user = Notice.created_at > user_created_at
-        not_read_by_user = ~Notice.reads.any(
-            NoticeRead.created_by_id == current_user_id
-        )
-
-        total_unread = await self.session.scalar(
-            select(func.count(Notice.id)).where(
-                created_after_user,
-                not_read_by_user,
-            )
-        )
-
-        unread_notices_result = await self.session.scalars(
-            select(Notice)
-            .where(
-                created_after_user,
-                not_read_by_user,
+        # Anti-join: avisos sem leitura do usuário, pelo índice único
+        # (created_by_id, notice_id) de notice_reads.
+        # O total vem de uma função de janela, calculada antes do LIMIT.
+        rows = (
+            await self.session.execute(
+                select(Notice, func.count().over().label('total'))
+                .outerjoin(
+                    NoticeRead,
+                    and_(
+                        NoticeRead.notice_id == Notice.id,
+                        NoticeRead.created_by_id == current_user_id,
+                    ),
+                )
+                .options(raiseload(Notice.reads))
+                .where(
+                    NoticeRead.id.is_(None),
+                    Notice.created_at > user_created_at,
+                )
+                .order_by(Notice.created_at.desc())
+                .limit(3)
             )
-            .order_by(Notice.created_at.desc())
-            .limit(3)
-        )
+        ).all()
 
-        return UnreadNoticesSummary(
-            total=total_unread if total_unread is not None else 0,
-            unread_notices=unread_notices_result.all(),
+        return UnreadNoticesSummary.model_construct(
+            total=rows[0].total if rows else 0,
+            unread_notices=UNREAD_NOTICE_LIST_ADAPTER.validate_python(
+                [row.Notice for row in rows], from_attributes=True
+            ),
         )
 
     async def _get_active_loans(self, current_user_id: int) -> Sequence[Loan]:
         loans_result = await self.session.scalars(
             select(Loan)
-            .options(selectinload(Loan.book))
+            # Só as colunas usadas por LoansByUser.
+            .options(
+                load_only(Loan.id, Loan.due_date, Loan.status, Loan.book_id),
+                selectinload(Loan.book).load_only(Book.id, Book.title),
+            )
             .where(
                 (Loan.created_by_id == current_user_id)
                 & (Loan.status.in_([LoanStatus.BORROWED, LoanStatus.LATE]))
@@ -90,10 +132,19 @@ class HomeService:
         )
         loans = await self._get_active_loans(current_user_id)
 
-        return HomeSummary(
-            current_month=self.today.strftime('%B'),
-            birthdays=birthdays,
-            legal_brief=legal_brief,
+        # As partes já chegam validadas; o modelo externo não revalida.
+        return HomeSummary.model_construct(
+            current_month=MONTHS_PT[self.today.month - 1],
+            birthdays=BIRTHDAY_LIST_ADAPTER.validate_python(
+                birthdays, from_attributes=True
+            ),
+            legal_brief=(
+                LegalBriefRandom.model_validate(legal_brief)
+                if legal_brief
+                else None
+            ),
             unread_notices=unread_notices,
-            loans=loans,
+            loans=LOANS_LIST_ADAPTER.validate_python(
+                loans, from_attributes=True
+            ),
         )
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from internum.core.models.mixins import AuditMixin
@@ -15,6 +15,21 @@ from internum.core.models.registry import table_registry
 @table_registry.mapped_as_dataclass
 class LegalBrief(AuditMixin):
     __tablename__ = 'legal_briefs'
+    # Índices trigram para as buscas ILIKE '%termo%' da listagem.
+    __table_args__ = (
+        Index(
+            'ix_legal_briefs_title_trgm',
+            'title',
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_legal_briefs_content_trgm',
+            'content',
+            postgresql_using='gin',
+            postgresql_ops={'content': 'gin_trgm_ops'},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     title: Mapped[str]
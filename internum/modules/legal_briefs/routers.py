@@ -1,20 +1,23 @@
 import math
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, or_, select
+from sqlalchemy import ColumnElement, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload
 
 from internum.core.database import get_session
+from internum.core.models.loaders import load_audit_users
 from internum.core.permissions import CurrentUser
 from internum.modules.legal_briefs.models import LegalBrief, LegalBriefRevision
 from internum.modules.legal_briefs.schemas import (
+    LEGAL_BRIEF_LIST_ADAPTER,
     LegalBriefCreate,
+    LegalBriefDetailSchema,
     LegalBriefQueryParams,
-    LegalBriefSchema,
     LegalBriefUpdate,
     PageMeta,
     PaginatedLegalBriefList,
@@ -23,9 +26,35 @@ from internum.modules.legal_briefs.schemas import (
 router = APIRouter(prefix='/legal-briefs', tags=['Legal Briefs'])
 Session = Annotated[AsyncSession, Depends(get_session)]
 
+BRIEF_USER_RELATIONS = ('created_by', 'updated_by', 'canceled_by')
+
+# Listagem e escritas não leem as revisões (nas escritas, a resposta vem
+# do reload).
+_SKIP_REVISIONS = raiseload(LegalBrief.revisions)
+
+
+async def _load_brief_users(
+    session: AsyncSession, legal_briefs: Sequence[LegalBrief]
+):
+    revisions = [rev for brief in legal_briefs for rev in brief.revisions]
+    await load_audit_users(
+        session, [*legal_briefs, *revisions], BRIEF_USER_RELATIONS
+    )
+
+
+async def _reload_brief(session: AsyncSession, legal_brief_id: int):
+    db_legal_brief = await session.scalar(
+        select(LegalBrief)
+        .where(LegalBrief.id == legal_brief_id)
+        .execution_options(populate_existing=True)
+    )
+    await _load_brief_users(session, [db_legal_brief])
+
+    return db_legal_brief
+
 
 @router.post(
-    '/', response_model=LegalBriefSchema, status_code=HTTPStatus.CREATED
+    '/', response_model=LegalBriefDetailSchema, status_code=HTTPStatus.CREATED
 )
 async def create_legal_brief(
     legal_brief: LegalBriefCreate, session: Session, current_user: CurrentUser
@@ -49,12 +78,74 @@ async def create_legal_brief(
     try:
         session.add(db_legal_brief)
         await session.commit()
-        await session.refresh(db_legal_brief)
     except Exception:
         await session.rollback()
         raise
 
-    return db_legal_brief
+    return await _reload_brief(session, db_legal_brief.id)
+
+
+async def _list_by_offset(
+    session: AsyncSession,
+    filters: Sequence[ColumnElement[bool]],
+    offset: int,
+    limit: int,
+):
+    # O total vem na mesma consulta da página (função de janela).
+    # A listagem não devolve revisões; elas ficam só no detalhe.
+    query_stmt = (
+        select(LegalBrief, func.count().over().label('total'))
+        .options(_SKIP_REVISIONS)
+        .where(*filters)
+        .order_by(LegalBrief.id)
+        .offset(offset)
+        .limit(limit)
+    )
+
+    rows = (await session.execute(query_stmt)).all()
+    legal_briefs = [row.LegalBrief for row in rows]
+
+    total: int = 0
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Página além do fim: a janela não traz linhas, conta à parte.
+        count_stmt = (
+            select(func.count()).select_from(LegalBrief).where(*filters)
+        )
+        total = (await session.scalar(count_stmt)) or 0
+
+    return legal_briefs, total
+
+
+async def _list_after_cursor(
+    session: AsyncSession,
+    filters: Sequence[ColumnElement[bool]],
+    after_id: int,
+    limit: int,
+):
+    # Paginação por chave: a página parte do índice da PK em vez de
+    # descartar `offset` linhas. Total e posição saem de uma só contagem.
+    query_stmt = (
+        select(LegalBrief)
+        .options(_SKIP_REVISIONS)
+        .where(*filters, LegalBrief.id > after_id)
+        .order_by(LegalBrief.id)
+        .limit(limit)
+    )
+    legal_briefs = list((await session.scalars(query_stmt)).all())
+
+    count_stmt = (
+        select(
+            func.count(),
+            func.count().filter(LegalBrief.id <= after_id),
+        )
+        .select_from(LegalBrief)
+        .where(*filters)
+    )
+    total, offset = (await session.execute(count_stmt)).one()
+
+    return legal_briefs, total, offset
 
 
 @router.get(
@@ -80,35 +171,22 @@ async def list_legal_briefs(
             )
         )
 
-    count_stmt = select(func.count()).select_from(LegalBrief)
-    if filters:
-        count_stmt = count_stmt.where(*filters)
-
-    total: int = (await session.scalar(count_stmt)) or 0
-
-    query_stmt = (
-        select(LegalBrief)
-        .options(
-            selectinload(LegalBrief.created_by),
-            selectinload(LegalBrief.updated_by),
-            selectinload(LegalBrief.canceled_by),
-            selectinload(LegalBrief.revisions),
+    if params.after_id is not None:
+        legal_briefs, total, offset = await _list_after_cursor(
+            session, filters, params.after_id, limit
+        )
+    else:
+        legal_briefs, total = await _list_by_offset(
+            session, filters, offset, limit
         )
-        .order_by(LegalBrief.id)
-        .offset(offset)
-        .limit(limit)
-    )
-
-    if filters:
-        query_stmt = query_stmt.where(*filters)
 
-    query = await session.scalars(query_stmt)
-    legal_briefs = query.all()
+    await load_audit_users(session, legal_briefs, BRIEF_USER_RELATIONS)
 
     total_pages = math.ceil(total / limit) if limit > 0 else 1
     page = (offset // limit) + 1 if limit > 0 else 1
     has_next = (offset + limit) < total
     has_prev = offset > 0
+    next_cursor = legal_briefs[-1].id if has_next and legal_briefs else None
 
     meta = PageMeta(
         total=total,
@@ -118,14 +196,20 @@ async def list_legal_briefs(
         has_next=has_next,
         has_prev=has_prev,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
-    return {'meta': meta, 'legal_briefs': legal_briefs}
+    return PaginatedLegalBriefList.model_construct(
+        meta=meta,
+        legal_briefs=LEGAL_BRIEF_LIST_ADAPTER.validate_python(
+            legal_briefs, from_attributes=True
+        ),
+    )
 
 
 @router.get(
     '/{legal_brief_id}',
-    response_model=LegalBriefSchema,
+    response_model=LegalBriefDetailSchema,
     status_code=HTTPStatus.OK,
     responses={
         HTTPStatus.NOT_FOUND: {
@@ -137,14 +221,7 @@ async def get_legal_brief_by_id(
     legal_brief_id: int, session: Session, current_user: CurrentUser
 ):
     db_legal_brief = await session.scalar(
-        select(LegalBrief)
-        .options(
-            selectinload(LegalBrief.created_by),
-            selectinload(LegalBrief.updated_by),
-            selectinload(LegalBrief.canceled_by),
-            selectinload(LegalBrief.revisions),
-        )
-        .where(LegalBrief.id == legal_brief_id)
+        select(LegalBrief).where(LegalBrief.id == legal_brief_id)
     )
 
     if not db_legal_brief:
@@ -153,13 +230,15 @@ async def get_legal_brief_by_id(
             detail=f'Legal Brief with id ({legal_brief_id}) not found.',
         )
 
+    await _load_brief_users(session, [db_legal_brief])
+
     return db_legal_brief
 
 
 @router.put(
     '/{legal_brief_id}',
     status_code=HTTPStatus.OK,
-    response_model=LegalBriefSchema,
+    response_model=LegalBriefDetailSchema,
     responses={
         HTTPStatus.NOT_FOUND: {'description': 'Legal Brief not found.'},
         HTTPStatus.BAD_REQUEST: {
@@ -183,7 +262,9 @@ async def update_legal_brief(
         )
 
     current_brief = await session.scalar(
-        select(LegalBrief).where(LegalBrief.id == legal_brief_id)
+        select(LegalBrief)
+        .options(_SKIP_REVISIONS)
+        .where(LegalBrief.id == legal_brief_id)
     )
 
     if not current_brief:
@@ -205,7 +286,6 @@ async def update_legal_brief(
             content=current_brief.content,
         )
         revision.created_by_id = current_brief.created_by_id
-        revision.created_by = current_brief.created_by
         revision.mark_updated(current_brief.id)
         session.add(revision)
 
@@ -213,20 +293,19 @@ async def update_legal_brief(
         current_brief.content = data.content or current_brief.content
         current_brief.updated_by_id = current_user.id
         current_brief.updated_at = datetime.now(UTC)
-        session.add(current_brief)
 
         await session.commit()
-        await session.refresh(current_brief)
     except Exception:
         await session.rollback()
         raise
 
-    return current_brief
+    # A revisão nova (e seu created_at do banco) só aparece recarregando.
+    return await _reload_brief(session, current_brief.id)
 
 
 @router.patch(
     '/{legal_brief_id}/cancel',
-    response_model=LegalBriefSchema,
+    response_model=LegalBriefDetailSchema,
     status_code=HTTPStatus.OK,
     responses={
         HTTPStatus.NOT_FOUND: {'description': 'Legal Brief not found.'},
@@ -242,12 +321,7 @@ async def cancel_legal_brief(
 ):
     db_legal_brief = await session.scalar(
         select(LegalBrief)
-        .options(
-            selectinload(LegalBrief.created_by),
-            selectinload(LegalBrief.updated_by),
-            selectinload(LegalBrief.canceled_by),
-            selectinload(LegalBrief.revisions),
-        )
+        .options(_SKIP_REVISIONS)
         .where(LegalBrief.id == legal_brief_id)
     )
 
@@ -268,6 +342,5 @@ async def cancel_legal_brief(
     db_legal_brief.canceled_at = datetime.now(UTC)
 
     await session.commit()
-    await session.refresh(db_legal_brief)
 
-    return db_legal_brief
+    return await _reload_brief(session, legal_brief_id)
@@ -1,8 +1,14 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
 from fastapi import Query
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, StringConstraints, TypeAdapter
+
+# Strip e tamanho mínimo feitos pelo pydantic-core, sem validador Python.
+StrippedStr = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1)
+]
 
 
 class UserPublic(BaseModel):
@@ -12,26 +18,22 @@ class UserPublic(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Entradas: sem campos extras nem coerção de tipos.
+_INPUT_CONFIG = ConfigDict(extra='forbid', strict=True, frozen=True)
+
+
 class LegalBriefCreate(BaseModel):
-    title: str = Field(..., min_length=1)
-    content: str = Field(..., min_length=1)
+    title: StrippedStr
+    content: StrippedStr
 
-    @field_validator('title', 'content', mode='before')
-    def strip_whitespace(cls, v):
-        if isinstance(v, str):
-            return v.strip()
-        return v  # pragma: no cover
+    model_config = _INPUT_CONFIG
 
 
 class LegalBriefUpdate(BaseModel):
-    title: str = Field(..., min_length=1)
-    content: str = Field(..., min_length=1)
+    title: StrippedStr
+    content: StrippedStr
 
-    @field_validator('title', 'content', mode='before')
-    def strip_whitespace(cls, v):
-        if isinstance(v, str):
-            return v.strip()
-        return v  # pragma: no cover
+    model_config = _INPUT_CONFIG
 
 
 class LegalBriefRevisionSchema(BaseModel):
@@ -60,12 +62,21 @@ class LegalBriefSchema(BaseModel):
     canceled_by: Optional[UserPublic] = None
     canceled_at: Optional[datetime] = None
 
-    revisions: list['LegalBriefRevisionSchema']
-
     model_config = ConfigDict(from_attributes=True)
 
 
-class PageMeta(BaseModel):
+class LegalBriefDetailSchema(LegalBriefSchema):
+    revisions: list[LegalBriefRevisionSchema]
+
+
+# Validador da página montado uma vez, reaproveitado a cada requisição.
+LEGAL_BRIEF_LIST_ADAPTER = TypeAdapter(list[LegalBriefSchema])
+
+
+# Sempre preenchido pelo servidor: dataclass simples, sem validação na
+# criação; o pydantic a serializa normalmente como campo da resposta.
+@dataclass(slots=True, frozen=True)
+class PageMeta:
     total: int
     page: int
     size: int
@@ -73,6 +84,7 @@ class PageMeta(BaseModel):
     has_next: bool
     has_prev: bool
     offset: int
+    next_cursor: Optional[int] = None
 
 
 class PaginatedLegalBriefList(BaseModel):
@@ -85,6 +97,11 @@ class LegalBriefQueryParams(BaseModel):
         default=10, ge=1, description='Number of items per page'
     )
     offset: int = Query(default=0, ge=0, description='Number of items to skip')
+    after_id: Optional[int] = Query(
+        default=None,
+        ge=0,
+        description='Cursor: return items after this id (ignores offset)',
+    )
 
     search: Optional[str] = Query(
         default=None,
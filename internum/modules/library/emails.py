@@ -0,0 +1,108 @@
+from html import escape
+from string import Template
+
+# Cabeçalho e rodapé comuns; cada email só define título e corpo.
+_LAYOUT = Template("""
+    <html>
+      <body
+        style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <h2 style="color: #4CAF50;">$heading</h2>
+        <p>Olá, $$name:</p>
+$content
+        <hr>
+    <p style="font-size: 0.9em; color: #888;">
+    Esta é uma mensagem automática do sistema Internum - 1º SRI de Cascavel/PR.
+    </p>
+      </body>
+    </html>
+    """)
+
+
+def _email_template(heading: str, content: str) -> Template:
+    return Template(_LAYOUT.substitute(heading=heading, content=content))
+
+
+def render_email(template: Template, **fields: str) -> str:
+    # Campos vindos do banco são escapados antes da substituição.
+    return template.substitute({
+        key: escape(value) for key, value in fields.items()
+    })
+
+
+LOAN_REQUEST_EMAIL = _email_template(
+    'Confirmação de Solicitação de Empréstimo',
+    """\
+        <p>Seu pedido de empréstimo foi registrado com sucesso e será
+         avaliado pela coordenação.</p>
+        <h3>Detalhes do Livro:</h3>
+        <ul>
+          <li><strong>Título:</strong> $title</li>
+          <li><strong>Autor:</strong> $author</li>
+        </ul>
+        <p><strong>Data/Hora da Solicitação:</strong> $when</p>""",
+)
+
+LOAN_CANCEL_EMAIL = _email_template(
+    'Confirmação de Cancelamento de Empréstimo',
+    """\
+        <p>Você cancelou seu pedido de emréstimo.</p>
+        <h3>Detalhes do Empréstimo:</h3>
+        <ul>
+          <li><strong>Título:</strong> $title</li>
+          <li><strong>Autor:</strong> $author</li>
+        </ul>
+        <p><strong>Data/Hora do Cancelamento:</strong> $when</p>""",
+)
+
+LOAN_APPROVE_EMAIL = _email_template(
+    'Confirmação de Aprovação de Empréstimo',
+    """\
+        <p>Seu pedido de empréstimo foi aprovado pela coordenação.</p>
+        <h3>Detalhes do Empréstimo:</h3>
+        <ul>
+          <li><strong>Título:</strong> $title</li>
+          <li><strong>Autor:</strong> $author</li>
+          <li><strong>Devolver até:</strong> $due</li>
+        </ul>
+        <p><strong>Data/Hora da Solicitação:</strong> $when</p>""",
+)
+
+LOAN_RETURN_EMAIL = _email_template(
+    'Confirmação de Devolução de Empréstimo',
+    """\
+        <p>Seu empréstimo foi devolvido com sucesso.</p>
+        <h3>Detalhes do Empréstimo:</h3>
+        <ul>
+          <li><strong>Título:</strong> $title</li>
+          <li><strong>Autor:</strong> $author</li>
+        </ul>
+        <p><strong>Data/Hora da Devolução:</strong> $when</p>""",
+)
+
+LOAN_REJECT_EMAIL = _email_template(
+    'Informação de Rejeição de Empréstimo',
+    """\
+        <p>
+        Seu empréstimo foi rejeitado pela coordenação. Para maiores
+        detalhes, procure seu coordendador
+        </p>
+        <h3>Detalhes do Empréstimo:</h3>
+        <ul>
+          <li><strong>Título:</strong> $title</li>
+          <li><strong>Autor:</strong> $author</li>
+        </ul>
+        <p><strong>Data/Hora da Rejeição:</strong> $when</p>""",
+)
+
+LATE_LOAN_EMAIL = _email_template(
+    'Aviso de Empréstimo Atrasado',
+    """\
+        <p>O empréstimo abaixo está atrasado:</p>
+        <h3>Detalhes do Livro:</h3>
+        <ul>
+          <li><strong>Título:</strong> $title</li>
+          <li><strong>Autor:</strong> $author</li>
+          <li><strong>Data da devolução:</strong> $due_str</li>
+        </ul>
+        <p><strong>Data/Hora do aviso:</strong> $alert_str</p>""",
+)
@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class LoanStatus(str, Enum):
+class LoanStatus(StrEnum):
     REQUESTED = 'requested'
     BORROWED = 'borrowed'
     RETURNED = 'returned'
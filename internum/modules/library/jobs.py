@@ -1,92 +1,109 @@
 import asyncio
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
-from internum.core.database import async_session_maker
 from internum.core.email import EmailService
+from internum.modules.library.emails import LATE_LOAN_EMAIL, render_email
 from internum.modules.library.enums import LoanStatus
 from internum.modules.library.models import Loan
 
 email_service = EmailService()
 
+SP_TZ = ZoneInfo('America/Sao_Paulo')
+UTC = timezone.utc
 
-async def check_overdue_loans():
-    print(
-        '[Scheduler] Verificando empréstimos vencidos às '
-        f'{datetime.now(timezone.utc)}'
-    )
-    async with async_session_maker() as session:
-        await _mark_overdue_loans(session)
-
-
-async def _mark_overdue_loans(session: AsyncSession):
-    """Marca empréstimos vencidos e envia email de aviso."""
-    today = datetime.utcnow()
-    result = await session.scalars(
-        select(Loan)
-        .options(selectinload(Loan.book), selectinload(Loan.created_by))
-        .where(
-            Loan.status == LoanStatus.BORROWED,
-            Loan.due_date < today,
+LATE_ALERT_BATCH_SIZE = 200
+
+
+async def mark_overdue_loans(session: AsyncSession):
+    """Marca empréstimos vencidos e retorna os ids que devem ser avisados."""
+    now = datetime.now(UTC)
+    print(f'[Scheduler] Verificando empréstimos vencidos às {now}')
+    # Vencido = devolução prevista antes do dia corrente (UTC); a transição
+    # é feita em um único UPDATE.
+    start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    updated_ids = (
+        await session.scalars(
+            update(Loan)
+            .where(
+                Loan.status == LoanStatus.BORROWED,
+                Loan.due_date < start_of_today,
+            )
+            .values(status=LoanStatus.LATE)
+            .returning(Loan.id)
         )
+    ).all()
+
+    if not updated_ids:
+        print('[Scheduler] Nenhum empréstimo vencido encontrado.')
+        return updated_ids
+
+    print(
+        f'[Scheduler] {len(updated_ids)} empréstimos marcados como vencidos.'
     )
-    loans = result.all()
+    return updated_ids
 
-    updated_count = 0
 
-    for loan in loans:
-        if loan.check_overdue():
-            await asyncio.to_thread(send_alert_late_loan, loan)
-            updated_count += 1
+async def load_late_loans(session: AsyncSession, loan_ids: Sequence[int]):
+    """Carrega um lote de empréstimos a avisar, já com livro e solicitante."""
+    if not loan_ids:
+        return []
 
-    if updated_count > 0:
-        await session.commit()
-        print(
-            f'[Scheduler] {updated_count} empréstimos marcados como vencidos.'
+    return (
+        await session.scalars(
+            select(Loan)
+            .options(selectinload(Loan.book), selectinload(Loan.created_by))
+            .where(Loan.id.in_(loan_ids))
         )
-    else:
-        print('[Scheduler] Nenhum empréstimo vencido encontrado.')
+    ).all()
+
+
+async def send_late_loan_alerts(
+    session_maker: async_sessionmaker[AsyncSession], loan_ids: Sequence[int]
+):
+    """Carrega e avisa um lote por vez; cada envio ocorre com a sessão
+    já fechada, e a memória fica limitada a LATE_ALERT_BATCH_SIZE."""
+    for start in range(0, len(loan_ids), LATE_ALERT_BATCH_SIZE):
+        batch_ids = loan_ids[start : start + LATE_ALERT_BATCH_SIZE]
+        async with session_maker() as session:
+            loans = await load_late_loans(session, batch_ids)
+        await send_alert_batch(loans)
 
 
-def send_alert_late_loan(loan: Loan):
-    alert_str = (
-        datetime.now(timezone.utc)
-        .astimezone(ZoneInfo('America/Sao_Paulo'))
-        .strftime('%d/%m/%Y, %H:%M:%S')
+async def send_alert_batch(loans: Sequence[Loan]):
+    """Envia os avisos em paralelo; uma falha não interrompe as demais."""
+    results = await asyncio.gather(
+        *(send_alert_late_loan(loan) for loan in loans),
+        return_exceptions=True,
     )
+    for loan, result in zip(loans, results):
+        if isinstance(result, Exception):
+            print(
+                f'[Scheduler] Falha ao avisar empréstimo {loan.id}: {result}'
+            )
+
+
+async def send_alert_late_loan(loan: Loan):
+    alert_str = datetime.now(SP_TZ).strftime('%d/%m/%Y, %H:%M:%S')
+
+    due_dt = loan.due_date.replace(tzinfo=UTC)
+    due_str = due_dt.astimezone(SP_TZ).strftime('%d/%m/%Y')
 
-    due_dt = loan.due_date.replace(tzinfo=timezone.utc)
-    due_str = due_dt.astimezone(ZoneInfo('America/Sao_Paulo')).strftime(
-        '%d/%m/%Y'
+    html_content = render_email(
+        LATE_LOAN_EMAIL,
+        name=loan.created_by.name,
+        title=loan.book.title,
+        author=loan.book.author,
+        due_str=due_str,
+        alert_str=alert_str,
     )
 
-    html_content = f"""
-    <html>
-      <body
-      style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <h2 style="color: #4CAF50;">Aviso de Empréstimo Atrasado</h2>
-        <p>Olá, {loan.created_by.name}:</p>
-        <p>O empréstimo abaixo está atrasado:</p>
-        <h3>Detalhes do Livro:</h3>
-        <ul>
-          <li><strong>Título:</strong> {loan.book.title}</li>
-          <li><strong>Autor:</strong> {loan.book.author}</li>
-          <li><strong>Data da devolução:</strong> {due_str}</li>
-        </ul>
-        <p><strong>Data/Hora do aviso:</strong> {alert_str}</p>
-        <hr>
-    <p style="font-size: 0.9em; color: #888;">
-    Esta é uma mensagem automática do sistema Internum - 1º SRI de Cascavel/PR.
-    </p>
-      </body>
-    </html>
-    """
-
-    email_service.send_email(
+    await email_service.send_email(
         email_to=[loan.created_by.email],
         subject='[Internhum] Aviso de Empréstimo Atrasado',
         html=html_content,
@@ -1,7 +1,7 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Text, text
 from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,6 +15,20 @@ from internum.modules.library.enums import LoanStatus
 @table_registry.mapped_as_dataclass
 class Book(AuditMixin):
     __tablename__ = 'books'
+    # Busca por ILIKE '%termo%' usa os índices trigram; (title, id) atende
+    # a ordenação e o cursor da listagem.
+    __table_args__ = (
+        *(
+            Index(
+                f'ix_books_{column}_trgm',
+                column,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+            for column in ('title', 'author', 'isbn')
+        ),
+        Index('ix_books_title_id', 'title', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     isbn: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
@@ -30,20 +44,21 @@ class Book(AuditMixin):
         back_populates='book', init=False
     )
 
-    def lend(self):
-        if self.available_quantity <= 0:
-            raise ValueError('Book not available for lending.')
-        self.available_quantity -= 1
-
-    def return_book(self):
-        if self.available_quantity >= self.quantity:
-            raise ValueError('Available quantity already at maximum.')
-        self.available_quantity += 1
-
 
 @table_registry.mapped_as_dataclass
 class Loan(AuditMixin):
     __tablename__ = 'loans'
+    # Busca de vencidos: só os empréstimos em aberto entram no índice.
+    # O enum é gravado pelo nome do membro, daí 'BORROWED'.
+    __table_args__ = (
+        Index(
+            'ix_loans_borrowed_due_date',
+            'due_date',
+            postgresql_where=text("status = 'BORROWED'"),
+        ),
+        # Ordenação e cursor das listagens por data de criação.
+        Index('ix_loans_created_at_id', 'created_at', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, init=False)
     book_id: Mapped[int] = mapped_column(ForeignKey('books.id'))
@@ -53,7 +68,10 @@ class Loan(AuditMixin):
         default=None,
     )
     approved_by: Mapped[Optional['User']] = relationship(
-        'User', foreign_keys=[approved_by_id], lazy='joined', init=False
+        'User',
+        foreign_keys=[approved_by_id],
+        lazy='raise_on_sql',
+        init=False,
     )
 
     loan_period_days: Mapped[int] = mapped_column(default=14)
@@ -80,43 +98,3 @@ class Loan(AuditMixin):
     )
 
     book: Mapped['Book'] = relationship(back_populates='loans', init=False)
-
-    def mark_as_canceled(self):
-        if self.status not in {LoanStatus.REQUESTED}:
-            raise ValueError('Loan is not currently pendind approve.')
-        self.status = LoanStatus.CANCELED
-        self.book.return_book()
-
-    def approve_and_start(self, approver: 'User'):
-        if self.status != LoanStatus.REQUESTED:
-            raise ValueError('Only requested loans can be started.')
-        self.status = LoanStatus.BORROWED
-        self.approved_by = approver
-        self.borrowed_at = datetime.now(timezone.utc)
-        self.due_date = datetime.now(timezone.utc) + timedelta(
-            days=self.loan_period_days
-        )
-
-    def reject(self, approver: 'User'):
-        if self.status != LoanStatus.REQUESTED:
-            raise ValueError('Only requested loans can be rejected.')
-        self.status = LoanStatus.REJECTED
-        self.approved_by = approver
-        self.book.return_book()
-
-    def mark_as_returned(self):
-        if self.status not in {LoanStatus.BORROWED, LoanStatus.LATE}:
-            raise ValueError('Loan is not currently borrowed.')
-        self.returned_at = datetime.now(timezone.utc)
-        self.status = LoanStatus.RETURNED
-        self.book.return_book()
-
-    def check_overdue(self):
-        if (
-            self.status == LoanStatus.BORROWED
-            and self.due_date.date()
-            and self.due_date.date() < datetime.now(timezone.utc).date()
-        ):
-            self.status = LoanStatus.LATE
-            return True
-        return False
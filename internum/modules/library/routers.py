@@ -1,16 +1,50 @@
-from datetime import datetime
+import base64
+import json
+import time
+from datetime import datetime, timezone
 from http import HTTPStatus
-from typing import Annotated
+from typing import Annotated, Any
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from sqlalchemy import asc, desc, func, or_, select
+from sqlalchemy import (
+    Select,
+    asc,
+    bindparam,
+    desc,
+    func,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    contains_eager,
+    raiseload,
+    selectinload,
+)
 
-from internum.core.database import get_session
+from internum.core.database import get_read_session, get_session
 from internum.core.email import EmailService
-from internum.core.permissions import CurrentUser
+from internum.core.models.loaders import load_audit_users
+from internum.core.permissions import (
+    CurrentReadUser,
+    CurrentUser,
+    VerifyAdminCoord,
+    VerifyAdminCoordRead,
+)
+from internum.modules.library.emails import (
+    LOAN_APPROVE_EMAIL,
+    LOAN_CANCEL_EMAIL,
+    LOAN_REJECT_EMAIL,
+    LOAN_REQUEST_EMAIL,
+    LOAN_RETURN_EMAIL,
+    render_email,
+)
 from internum.modules.library.enums import LoanStatus
 from internum.modules.library.models import Book, Loan
 from internum.modules.library.schemas import (
@@ -29,9 +63,42 @@ from internum.modules.users.models import User
 
 router = APIRouter(prefix='/library', tags=['Library'])
 Session = Annotated[AsyncSession, Depends(get_session)]
+ReadSession = Annotated[AsyncSession, Depends(get_read_session)]
 
 email_service = EmailService()
 
+SP_TZ = ZoneInfo('America/Sao_Paulo')
+_FMT_DT = '%d/%m/%Y %H:%M:%S'
+_FMT_D = '%d/%m/%Y'
+
+LOAN_USER_RELATIONS = ('created_by', 'approved_by')
+
+# Nas leituras, relações fora dos loaders explícitos levantam erro em vez
+# de virar lazy load (N+1) durante a serialização.
+_NO_LAZY = raiseload('*')
+
+# Só empréstimos em curso (no prazo ou atrasados) podem ser devolvidos.
+_RETURNABLE_STATUSES = (LoanStatus.BORROWED, LoanStatus.LATE)
+
+# Consultas por id montadas uma vez no import: a requisição só passa o
+# parâmetro, sem reconstruir a árvore do SELECT.
+_BOOK_BY_ID = (
+    select(Book)
+    .options(selectinload(Book.loans), _NO_LAZY)
+    .where(Book.id == bindparam('book_id'), Book.deleted_at.is_(None))
+)
+_LOAN_BY_ID = select(Loan).where(
+    Loan.id == bindparam('loan_id'), Loan.deleted_at.is_(None)
+)
+
+# Teto do tamanho de página, independente da validação dos parâmetros.
+MAX_PAGE_SIZE = 200
+
+BOOK_LIST_CACHE_TTL_SECONDS = 30
+
+# limit -> (expira_em, primeira página sem busca). Cache por processo;
+# entre workers a defasagem é limitada pelo TTL.
+_book_list_cache: dict[int, tuple[float, PaginatedBooksList]] = {}
 
 ALLOWED_SORT_FIELDS = {
     'id': Loan.id,
@@ -42,46 +109,199 @@ ALLOWED_SORT_FIELDS = {
 }
 
 
+async def _fetch_page(
+    session: AsyncSession, stmt: Select, offset: int, limit: int
+):
+    """Retorna os itens da página e o total, numa só consulta."""
+    rows = (
+        await session.execute(
+            stmt.add_columns(func.count().over().label('total'))
+            .offset(offset)
+            .limit(limit)
+        )
+    ).all()
+
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    if not offset:
+        return [], 0
+
+    # Página além do fim: a janela não traz linhas, conta à parte.
+    count_stmt = select(func.count()).select_from(
+        stmt.order_by(None).subquery()
+    )
+    return [], (await session.scalar(count_stmt)) or 0
+
+
+def _encode_cursor(value, row_id: int) -> str:
+    """Cursor opaco com a chave (coluna de ordenação, id) da última linha."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str, parse=str):
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return parse(value), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor.'
+        )
+
+
+def _after_cursor(
+    stmt: Select,
+    key: tuple[InstrumentedAttribute, InstrumentedAttribute],
+    cursor_key: tuple[Any, int],
+    *,
+    descending: bool,
+) -> Select:
+    """Restringe ``stmt`` às linhas depois do cursor (paginação por chave).
+
+    ``stmt`` já deve estar ordenado por ``key``; a página começa por um
+    range no índice em vez de descartar ``offset`` linhas.
+    """
+    if descending:
+        return stmt.where(tuple_(*key) < tuple_(*cursor_key))
+    return stmt.where(tuple_(*key) > tuple_(*cursor_key))
+
+
+async def _fetch_probe(session: AsyncSession, stmt: Select, limit: int):
+    """Busca limit + 1 linhas: a sobra indica se há próxima página."""
+    rows = (await session.scalars(stmt.limit(limit + 1))).all()
+    return rows[:limit], len(rows) > limit
+
+
+def _offset_meta(total: int, offset: int, limit: int) -> PageMeta:
+    return PageMeta(
+        total=total,
+        page=(offset // limit) + 1,
+        size=limit,
+        total_pages=(total + limit - 1) // limit,
+        has_next=offset + limit < total,
+        has_prev=offset > 0,
+        offset=offset,
+    )
+
+
+def _uncounted_meta(offset: int, limit: int, has_next: bool) -> PageMeta:
+    return PageMeta(
+        total=None,
+        page=(offset // limit) + 1,
+        size=limit,
+        total_pages=None,
+        has_next=has_next,
+        has_prev=offset > 0,
+        offset=offset,
+    )
+
+
+def _cursor_meta(limit: int, has_next: bool) -> PageMeta:
+    # Sem contagem: o cursor existe justamente para não varrer a tabela.
+    return PageMeta(
+        total=None,
+        page=None,
+        size=limit,
+        total_pages=None,
+        has_next=has_next,
+        has_prev=True,
+        offset=None,
+    )
+
+
+# Abaixo disso a contagem exata é barata e a estimativa pode estar velha.
+ESTIMATED_COUNT_MIN_ROWS = 10_000
+
+_RELTUPLES_SQL = text(
+    'SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:t AS regclass)'
+)
+
+
+def invalidate_book_list_cache():
+    """Descarta as páginas em cache após mudanças no acervo."""
+    _book_list_cache.clear()
+
+
+async def _estimated_total(session: AsyncSession, table: str):
+    """Estimativa do planner para tabelas grandes; None nas pequenas."""
+    estimate = await session.scalar(_RELTUPLES_SQL, {'t': table})
+    if estimate is None or estimate < ESTIMATED_COUNT_MIN_ROWS:
+        return None
+    return estimate
+
+
+async def _guarded_loan_update(
+    session: AsyncSession, loan_id: int, guards, values: dict
+):
+    """Aplica a transição só se as guardas valerem; None caso contrário.
+
+    A guarda no WHERE substitui o SELECT + checagem em Python e evita que
+    duas requisições simultâneas façam a mesma transição.
+    """
+    return (
+        await session.scalars(
+            update(Loan)
+            .where(Loan.id == loan_id, Loan.deleted_at.is_(None), *guards)
+            .values(**values)
+            .returning(Loan)
+        )
+    ).one_or_none()
+
+
+async def _get_loan(session: AsyncSession, loan_id: int):
+    # Só no caminho de erro, para escolher entre 404, 403 e 400.
+    return await session.scalar(_LOAN_BY_ID, {'loan_id': loan_id})
+
+
+async def _release_book(session: AsyncSession, book_id: int):
+    """Devolve o exemplar ao acervo e retorna título e autor do livro."""
+    book_row = (
+        await session.execute(
+            update(Book)
+            .where(Book.id == book_id, Book.available_quantity < Book.quantity)
+            .values(available_quantity=Book.available_quantity + 1)
+            .returning(Book.title, Book.author)
+        )
+    ).first()
+
+    if book_row is None:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Available quantity already at maximum.',
+        )
+    return book_row
+
+
 @router.post(
     '/books', status_code=HTTPStatus.CREATED, response_model=BookBaseSchema
 )
 async def create_book(
-    session: Session, book: BookCreateSchema, current_user: CurrentUser
+    session: Session, book: BookCreateSchema, current_user: VerifyAdminCoord
 ):
-    if current_user.role not in {
-        'admin',
-        'coord',
-    }:
-        raise HTTPException(
-            status_code=HTTPStatus.FORBIDDEN,
-            detail='You are not allowed to create a loan.',
+    # A constraint única de isbn decide o conflito, sem SELECT prévio.
+    stmt = (
+        pg_insert(Book)
+        .values(
+            **book.model_dump(),
+            quantity=1,
+            available_quantity=1,
+            created_by_id=current_user.id,
         )
+        .on_conflict_do_nothing(index_elements=[Book.isbn])
+        .returning(Book)
+    )
+    book_db = (await session.scalars(stmt)).one_or_none()
 
-    stmt = select(Book).where(Book.isbn == book.isbn)
-    existing = await session.scalar(stmt)
-
-    if existing:
+    if book_db is None:
         raise HTTPException(
             status_code=HTTPStatus.CONFLICT,
             detail='Book with this ISBN already exists.',
         )
 
-    book_db = Book(
-        isbn=book.isbn,
-        title=book.title,
-        author=book.author,
-        publisher=book.publisher,
-        edition=book.edition,
-        year=book.year,
-        quantity=1,
-        available_quantity=1,
-    )
-
-    book_db.created_by_id = current_user.id
-
-    session.add(book_db)
     await session.commit()
-    await session.refresh(book_db)
+    invalidate_book_list_cache()
 
     return book_db
 
@@ -92,13 +312,25 @@ async def create_book(
     response_model=PaginatedBooksList,
 )
 async def list_books(
-    session: Session,
+    session: ReadSession,
     params: Annotated[BookQueryParams, Depends()],
-    current_user: CurrentUser,
+    current_user: CurrentReadUser,
 ):
-    limit = max(1, params.limit)
+    limit = min(max(1, params.limit), MAX_PAGE_SIZE)
     offset = max(0, params.offset)
 
+    # A primeira página sem busca é a mais acessada: serve do cache.
+    cacheable = (
+        not params.search
+        and offset == 0
+        and not params.cursor
+        and params.include_total
+    )
+    if cacheable:
+        cached = _book_list_cache.get(limit)
+        if cached and cached[0] > time.time():
+            return cached[1]
+
     filters = [Book.deleted_at.is_(None)]
 
     if params.search:
@@ -111,34 +343,48 @@ async def list_books(
             )
         )
 
-    count_stmt = select(func.count()).select_from(Book).where(*filters)
-    total = (await session.scalar(count_stmt)) or 0
-
+    # A listagem usa BookBaseSchema, sem empréstimos: nada a carregar.
     stmt = (
         select(Book)
-        .options(selectinload(Book.loans))
+        .options(_NO_LAZY)
         .where(*filters)
-        .order_by(Book.title.asc())
-        .offset(offset)
-        .limit(limit)
+        .order_by(Book.title.asc(), Book.id.asc())
     )
 
-    books = (await session.scalars(stmt)).unique().all()
+    if params.cursor:
+        books, has_next = await _fetch_probe(
+            session,
+            _after_cursor(
+                stmt,
+                (Book.title, Book.id),
+                _decode_cursor(params.cursor),
+                descending=False,
+            ),
+            limit,
+        )
+        meta = _cursor_meta(limit, has_next)
+    elif not params.include_total:
+        books, has_next = await _fetch_probe(
+            session, stmt.offset(offset), limit
+        )
+        meta = _uncounted_meta(offset, limit, has_next)
+    else:
+        books, total = await _fetch_page(session, stmt, offset, limit)
+        meta = _offset_meta(total, offset, limit)
 
-    total_pages = (total + limit - 1) // limit
-    current_page = (offset // limit) + 1
+    if meta.has_next and books:
+        meta.next_cursor = _encode_cursor(books[-1].title, books[-1].id)
 
-    meta = PageMeta(
-        total=total,
-        page=current_page,
-        size=limit,
-        total_pages=total_pages,
-        has_next=offset + limit < total,
-        has_prev=offset > 0,
-        offset=offset,
+    result = PaginatedBooksList.model_validate(
+        {'meta': meta, 'books': books}, from_attributes=True
     )
+    if cacheable:
+        _book_list_cache[limit] = (
+            time.time() + BOOK_LIST_CACHE_TTL_SECONDS,
+            result,
+        )
 
-    return {'meta': meta, 'books': books}
+    return result
 
 
 @router.get(
@@ -147,15 +393,9 @@ async def list_books(
     response_model=BookDetailSchema,
 )
 async def get_book_by_id(
-    session: Session, book_id: int, current_user: CurrentUser
+    session: ReadSession, book_id: int, current_user: CurrentReadUser
 ):
-    book_db = await session.scalar(
-        select(Book)
-        .options(
-            selectinload(Book.loans),
-        )
-        .where(Book.id == book_id, Book.deleted_at.is_(None))
-    )
+    book_db = await session.scalar(_BOOK_BY_ID, {'book_id': book_id})
 
     if not book_db:
         raise HTTPException(
@@ -163,6 +403,8 @@ async def get_book_by_id(
             detail=f'Book with id ({book_id}) not found.',
         )
 
+    await load_audit_users(session, book_db.loans, LOAN_USER_RELATIONS)
+
     return book_db
 
 
@@ -175,20 +417,30 @@ async def update_book(
     session: Session,
     book_id: int,
     book_update: BookUpdateSchema,
-    current_user: CurrentUser,
+    current_user: VerifyAdminCoord,
 ):
-    if current_user.role not in {
-        'admin',
-        'coord',
-    }:
-        raise HTTPException(
-            status_code=HTTPStatus.FORBIDDEN,
-            detail='You are not allowed to update this loan.',
+    update_data = book_update.model_dump(exclude_unset=True)
+    quantity = update_data.pop('quantity', None)
+
+    if quantity is not None:
+        # O ajuste do disponível é calculado no próprio UPDATE.
+        update_data['quantity'] = quantity
+        update_data['available_quantity'] = func.greatest(
+            Book.available_quantity + (quantity - Book.quantity), 0
         )
 
-    book_db = await session.scalar(
-        select(Book).where(Book.id == book_id, Book.deleted_at.is_(None))
-    )
+    # updated_at vem do onupdate da coluna, no relógio do banco.
+    update_data['updated_by_id'] = current_user.id
+
+    # Sem SELECT prévio: o UPDATE filtra, grava e devolve o livro.
+    book_db = (
+        await session.scalars(
+            update(Book)
+            .where(Book.id == book_id, Book.deleted_at.is_(None))
+            .values(**update_data)
+            .returning(Book)
+        )
+    ).one_or_none()
 
     if not book_db:
         raise HTTPException(
@@ -196,59 +448,34 @@ async def update_book(
             detail=f'Book with id ({book_id}) not found.',
         )
 
-    update_data = book_update.dict(exclude_unset=True)
-
-    update_data['updated_at'] = datetime.utcnow()
-
-    if book_update.quantity is not None:
-        diff = book_update.quantity - book_db.quantity
-        book_db.quantity = book_update.quantity
-        book_db.available_quantity += diff
-
-    book_db.available_quantity = max(book_db.available_quantity, 0)
-
-    for field, value in update_data.items():
-        if field == 'quantity':
-            continue
-        if hasattr(book_db, field):
-            setattr(book_db, field, value)
-
-    book_db.mark_updated(current_user.id)
-
-    session.add(book_db)
     await session.commit()
-    await session.refresh(book_db)
+    invalidate_book_list_cache()
 
     return book_db
 
 
 @router.delete('/books/{book_id}', status_code=HTTPStatus.NO_CONTENT)
 async def soft_delete_book(
-    session: Session, book_id: int, current_user: CurrentUser
+    session: Session, book_id: int, current_user: VerifyAdminCoord
 ):
-    if current_user.role not in {
-        'admin',
-        'coord',
-    }:
-        raise HTTPException(
-            status_code=HTTPStatus.FORBIDDEN,
-            detail='You are not allowed to delete this loan.',
+    deleted_id = await session.scalar(
+        update(Book)
+        .where(Book.id == book_id, Book.deleted_at.is_(None))
+        .values(
+            deleted_at=datetime.now(timezone.utc),
+            deleted_by_id=current_user.id,
         )
-
-    book_db = await session.scalar(
-        select(Book).where(Book.id == book_id, Book.deleted_at.is_(None))
+        .returning(Book.id)
     )
 
-    if not book_db:
+    if not deleted_id:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail=f'Book with id ({book_id}) not found.',
         )
 
-    book_db.soft_delete(current_user.id)
-
-    session.add(book_db)
     await session.commit()
+    invalidate_book_list_cache()
 
 
 @router.post(
@@ -262,59 +489,54 @@ async def request_loan(
     current_user: CurrentUser,
     background_tasks: BackgroundTasks,
 ):
-    book_db = await session.scalar(
-        select(Book).where(Book.id == book_id, Book.deleted_at.is_(None))
-    )
+    # Baixa condicional e atômica: dois pedidos simultâneos não emprestam
+    # o mesmo exemplar, e o título/autor do email vêm do RETURNING.
+    book_row = (
+        await session.execute(
+            update(Book)
+            .where(
+                Book.id == book_id,
+                Book.deleted_at.is_(None),
+                Book.available_quantity > 0,
+            )
+            .values(available_quantity=Book.available_quantity - 1)
+            .returning(Book.title, Book.author)
+        )
+    ).first()
 
-    if not book_db:
+    if book_row is None:
+        book_exists = await session.scalar(
+            select(Book.id).where(
+                Book.id == book_id, Book.deleted_at.is_(None)
+            )
+        )
+        if not book_exists:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail=f'Book with id ({book_id}) not found.',
+            )
         raise HTTPException(
-            status_code=HTTPStatus.NOT_FOUND,
-            detail=f'Book with id ({book_id}) not found.',
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Book not available for lending.',
         )
 
     new_loan = Loan(book_id=book_id)
     new_loan.created_by_id = current_user.id
 
-    try:
-        book_db.lend()
-    except ValueError as e:
-        raise HTTPException(
-            status_code=HTTPStatus.BAD_REQUEST,
-            detail=str(e),
-        )
-
-    session.add_all([new_loan, book_db])
+    # created_at volta no RETURNING do INSERT; dispensa o refresh.
+    session.add(new_loan)
     await session.commit()
-    await session.refresh(new_loan)
-
-    requested_str = new_loan.created_at.astimezone(
-        ZoneInfo('America/Sao_Paulo')
-    ).strftime('%d/%m/%Y %H:%M:%S')
-
-    html_content = f"""
-    <html>
-      <body
-        style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <h2 style="color: #4CAF50;">
-            Confirmação de Solicitação de Empréstimo
-        </h2>
-        <p>Olá, {current_user.name}:</p>
-        <p>Seu pedido de empréstimo foi registrado com sucesso e será avaliado
-         pela coordenação.</p>
-        <h3>Detalhes do Livro:</h3>
-        <ul>
-          <li><strong>Título:</strong> {book_db.title}</li>
-          <li><strong>Autor:</strong> {book_db.author}</li>
-        </ul>
-        <p><strong>Data/Hora da Solicitação:</strong> {requested_str}</p>
-        <hr>
-        <p style="font-size: 0.9em; color: #888;">
-          Esta é uma mensagem automática do sistema I
-          nternum - 1º SRI de Cascavel/PR.
-        </p>
-      </body>
-    </html>
-    """
+    invalidate_book_list_cache()
+
+    requested_str = new_loan.created_at.astimezone(SP_TZ).strftime(_FMT_DT)
+
+    html_content = render_email(
+        LOAN_REQUEST_EMAIL,
+        name=current_user.name,
+        title=book_row.title,
+        author=book_row.author,
+        when=requested_str,
+    )
 
     background_tasks.add_task(
         email_service.send_email,
@@ -338,60 +560,50 @@ async def cancel_loan(
     current_user: CurrentUser,
     background_tasks: BackgroundTasks,
 ):
-    loan_db = await session.scalar(
-        select(Loan)
-        .options(selectinload(Loan.book), selectinload(Loan.created_by))
-        .where(Loan.id == loan_id, Loan.deleted_at.is_(None))
+    loan_db = await _guarded_loan_update(
+        session,
+        loan_id,
+        (
+            Loan.status == LoanStatus.REQUESTED,
+            Loan.created_by_id == current_user.id,
+        ),
+        {
+            'status': LoanStatus.CANCELED,
+            'updated_by_id': current_user.id,
+            'updated_at': datetime.now(timezone.utc),
+        },
     )
 
     if not loan_db:
-        raise HTTPException(status_code=404, detail='Loan not found.')
+        current = await _get_loan(session, loan_id)
+        if not current:
+            raise HTTPException(status_code=404, detail='Loan not found.')
 
-    if loan_db.status != LoanStatus.REQUESTED:
-        raise HTTPException(
-            status_code=400, detail='Only pending requests can be canceled.'
-        )
+        if current.status != LoanStatus.REQUESTED:
+            raise HTTPException(
+                status_code=400,
+                detail='Only pending requests can be canceled.',
+            )
 
-    if loan_db.created_by_id != current_user.id:
         raise HTTPException(
             status_code=HTTPStatus.FORBIDDEN,
             detail='You are not allowed to cancel this loan.',
         )
 
-    loan_db.mark_as_canceled()
-    loan_db.updated_by_id = current_user.id
-    loan_db.updated_at = datetime.utcnow()
+    book_row = await _release_book(session, loan_db.book_id)
 
     await session.commit()
-    await session.refresh(loan_db)
-
-    canceled_str = loan_db.updated_at.astimezone(
-        ZoneInfo('America/Sao_Paulo')
-    ).strftime('%d/%m/%Y %H:%M:%S')
-
-    html_content = f"""
-    <html>
-      <body
-        style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <h2 style="color: #4CAF50;">
-            Confirmação de Cancelamento de Empréstimo
-        </h2>
-        <p>Olá, {current_user.name}:</p>
-        <p>Você cancelou seu pedido de emréstimo.</p>
-        <h3>Detalhes do Empréstimo:</h3>
-        <ul>
-          <li><strong>Título:</strong> {loan_db.book.title}</li>
-          <li><strong>Autor:</strong> {loan_db.book.author}</li>
-        </ul>
-        <p><strong>Data/Hora do Cancelamento:</strong> {canceled_str}</p>
-        <hr>
-        <p style="font-size: 0.9em; color: #888;">
-          Esta é uma mensagem automática do sistema I
-          nternum - 1º SRI de Cascavel/PR.
-        </p>
-      </body>
-    </html>
-    """
+    invalidate_book_list_cache()
+
+    canceled_str = loan_db.updated_at.astimezone(SP_TZ).strftime(_FMT_DT)
+
+    html_content = render_email(
+        LOAN_CANCEL_EMAIL,
+        name=current_user.name,
+        title=book_row.title,
+        author=book_row.author,
+        when=canceled_str,
+    )
 
     background_tasks.add_task(
         email_service.send_email,
@@ -412,75 +624,67 @@ async def cancel_loan(
 async def approve_and_start_loan(
     session: Session,
     loan_id: int,
-    current_user: CurrentUser,
+    current_user: VerifyAdminCoord,
     background_tasks: BackgroundTasks,
 ):
-    if current_user.role not in {
-        'admin',
-        'coord',
-    }:
-        raise HTTPException(
-            status_code=HTTPStatus.FORBIDDEN,
-            detail='You are not allowed to approve this loan.',
-        )
-
-    loan_db = await session.scalar(
-        select(Loan)
-        .where(Loan.id == loan_id, Loan.deleted_at.is_(None))
-        .options(selectinload(Loan.book), selectinload(Loan.created_by))
+    now = datetime.now(timezone.utc)
+    loan_db = await _guarded_loan_update(
+        session,
+        loan_id,
+        (Loan.status == LoanStatus.REQUESTED,),
+        {
+            'status': LoanStatus.BORROWED,
+            'approved_by_id': current_user.id,
+            'updated_by_id': current_user.id,
+            'borrowed_at': now,
+            'due_date': now
+            + func.make_interval(0, 0, 0, Loan.loan_period_days),
+        },
     )
 
     if not loan_db:
+        if not await _get_loan(session, loan_id):
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail=f'Loan with id ({loan_id}) not found.',
+            )
         raise HTTPException(
-            status_code=HTTPStatus.NOT_FOUND,
-            detail=f'Loan with id ({loan_id}) not found.',
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Only requested loans can be started.',
         )
 
-    try:
-        loan_db.approve_and_start(current_user)
-        loan_db.mark_updated(current_user.id)
-    except ValueError as e:
-        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+    # Dados do email: livro e solicitante numa só consulta.
+    mail_row = (
+        await session.execute(
+            select(Book.title, Book.author, User.email)
+            .select_from(Loan)
+            .join(Book, Book.id == Loan.book_id)
+            .join(User, User.id == Loan.created_by_id)
+            .where(Loan.id == loan_id)
+        )
+    ).one_or_none()
 
-    session.add(loan_db)
     await session.commit()
-    await session.refresh(loan_db)
-
-    requested_str = loan_db.borrowed_at.astimezone(
-        ZoneInfo('America/Sao_Paulo')
-    ).strftime('%d/%m/%Y %H:%M:%S')
-    due_date_str = loan_db.due_date.astimezone(
-        ZoneInfo('America/Sao_Paulo')
-    ).strftime('%d/%m/%Y')
-
-    html_content = f"""
-    <html>
-      <body
-        style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <h2 style="color: #4CAF50;">
-            Confirmação de Aprovação de Empréstimo
-        </h2>
-        <p>Olá, {current_user.name}:</p>
-        <p>Seu pedido de empréstimo foi aprovado pela coordenação.</p>
-        <h3>Detalhes do Empréstimo:</h3>
-        <ul>
-          <li><strong>Título:</strong> {loan_db.book.title}</li>
-          <li><strong>Autor:</strong> {loan_db.book.author}</li>
-          <li><strong>Devolver até:</strong> {due_date_str}
-        </ul>
-        <p><strong>Data/Hora da Solicitação:</strong> {requested_str}</p>
-        <hr>
-        <p style="font-size: 0.9em; color: #888;">
-          Esta é uma mensagem automática do sistema I
-          nternum - 1º SRI de Cascavel/PR.
-        </p>
-      </body>
-    </html>
-    """
+
+    # Solicitante removido (created_by_id nulo): não há a quem avisar.
+    if mail_row is None:
+        return loan_db
+
+    requested_str = loan_db.borrowed_at.astimezone(SP_TZ).strftime(_FMT_DT)
+    due_date_str = loan_db.due_date.astimezone(SP_TZ).strftime(_FMT_D)
+
+    html_content = render_email(
+        LOAN_APPROVE_EMAIL,
+        name=current_user.name,
+        title=mail_row.title,
+        author=mail_row.author,
+        due=due_date_str,
+        when=requested_str,
+    )
 
     background_tasks.add_task(
         email_service.send_email,
-        email_to=[loan_db.created_by.email],
+        email_to=[mail_row.email],
         subject='[Internum] Confirmação de Aprovação de Empréstimo',
         html=html_content,
         category='Loan Approve',
@@ -500,64 +704,55 @@ async def return_loan(
     current_user: CurrentUser,
     background_tasks: BackgroundTasks,
 ):
-    loan_db = await session.scalar(
-        select(Loan)
-        .options(selectinload(Loan.book), selectinload(Loan.created_by))
-        .where(Loan.id == loan_id, Loan.deleted_at.is_(None))
+    is_staff = current_user.role in {'admin', 'coord'}
+    guards = [Loan.status.in_(_RETURNABLE_STATUSES)]
+    if not is_staff:
+        guards.append(Loan.created_by_id == current_user.id)
+
+    loan_db = await _guarded_loan_update(
+        session,
+        loan_id,
+        guards,
+        {
+            'status': LoanStatus.RETURNED,
+            'returned_at': datetime.now(timezone.utc),
+            'updated_by_id': current_user.id,
+        },
     )
 
     if not loan_db:
-        raise HTTPException(
-            status_code=HTTPStatus.NOT_FOUND,
-            detail=f'Loan with id ({loan_id}) not found.',
-        )
+        current = await _get_loan(session, loan_id)
+        if not current:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail=f'Loan with id ({loan_id}) not found.',
+            )
+
+        if not is_staff and current.created_by_id != current_user.id:
+            raise HTTPException(
+                status_code=HTTPStatus.FORBIDDEN,
+                detail='You are not allowed to return this loan.',
+            )
 
-    if loan_db.created_by_id != current_user.id and current_user.role not in {
-        'admin',
-        'coord',
-    }:
         raise HTTPException(
-            status_code=HTTPStatus.FORBIDDEN,
-            detail='You are not allowed to return this loan.',
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Loan is not currently borrowed.',
         )
 
-    try:
-        loan_db.mark_as_returned()
-        loan_db.mark_updated(current_user.id)
-    except ValueError as e:
-        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+    book_row = await _release_book(session, loan_db.book_id)
 
-    session.add(loan_db)
     await session.commit()
-    await session.refresh(loan_db)
-
-    returned_str = loan_db.returned_at.astimezone(
-        ZoneInfo('America/Sao_Paulo')
-    ).strftime('%d/%m/%Y %H:%M:%S')
-
-    html_content = f"""
-    <html>
-      <body
-        style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <h2 style="color: #4CAF50;">
-            Confirmação de Devolução de Empréstimo
-        </h2>
-        <p>Olá, {current_user.name}:</p>
-        <p>Seu empréstimo foi devolvido com sucesso.</p>
-        <h3>Detalhes do Empréstimo:</h3>
-        <ul>
-          <li><strong>Título:</strong> {loan_db.book.title}</li>
-          <li><strong>Autor:</strong> {loan_db.book.author}</li>
-        </ul>
-        <p><strong>Data/Hora da Devolução:</strong> {returned_str}</p>
-        <hr>
-        <p style="font-size: 0.9em; color: #888;">
-          Esta é uma mensagem automática do sistema I
-          nternum - 1º SRI de Cascavel/PR.
-        </p>
-      </body>
-    </html>
-    """
+    invalidate_book_list_cache()
+
+    returned_str = loan_db.returned_at.astimezone(SP_TZ).strftime(_FMT_DT)
+
+    html_content = render_email(
+        LOAN_RETURN_EMAIL,
+        name=current_user.name,
+        title=book_row.title,
+        author=book_row.author,
+        when=returned_str,
+    )
 
     background_tasks.add_task(
         email_service.send_email,
@@ -578,70 +773,46 @@ async def return_loan(
 async def reject_loan(
     session: Session,
     loan_id: int,
-    current_user: CurrentUser,
+    current_user: VerifyAdminCoord,
     background_tasks: BackgroundTasks,
 ):
-    if current_user.role not in {
-        'admin',
-        'coord',
-    }:
-        raise HTTPException(
-            status_code=HTTPStatus.FORBIDDEN,
-            detail='You are not allowed to reject this loan.',
-        )
-
-    loan_db = await session.scalar(
-        select(Loan)
-        .options(selectinload(Loan.book), selectinload(Loan.created_by))
-        .where(Loan.id == loan_id, Loan.deleted_at.is_(None))
+    loan_db = await _guarded_loan_update(
+        session,
+        loan_id,
+        (Loan.status == LoanStatus.REQUESTED,),
+        {
+            'status': LoanStatus.REJECTED,
+            'approved_by_id': current_user.id,
+            'updated_by_id': current_user.id,
+            'updated_at': datetime.now(timezone.utc),
+        },
     )
 
     if not loan_db:
+        if not await _get_loan(session, loan_id):
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail=f'Loan with id ({loan_id}) not found.',
+            )
         raise HTTPException(
-            status_code=HTTPStatus.NOT_FOUND,
-            detail=f'Loan with id ({loan_id}) not found.',
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Only requested loans can be rejected.',
         )
 
-    try:
-        loan_db.reject(current_user)
-        loan_db.mark_updated(current_user.id)
-    except ValueError as e:
-        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+    book_row = await _release_book(session, loan_db.book_id)
 
-    session.add(loan_db)
     await session.commit()
-    await session.refresh(loan_db)
-
-    reject_str = loan_db.updated_at.astimezone(
-        ZoneInfo('America/Sao_Paulo')
-    ).strftime('%d/%m/%Y %H:%M:%S')
-
-    html_content = f"""
-    <html>
-      <body
-        style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <h2 style="color: #4CAF50;">
-            Informação de Rejeição de Empréstimo
-        </h2>
-        <p>Olá, {current_user.name}:</p>
-        <p>
-        Seu empréstimo foi rejeitado pela coordenação. Para maiores detalhes, 
-        procure seu coordendador
-        </p>
-        <h3>Detalhes do Empréstimo:</h3>
-        <ul>
-          <li><strong>Título:</strong> {loan_db.book.title}</li>
-          <li><strong>Autor:</strong> {loan_db.book.author}</li>
-        </ul>
-        <p><strong>Data/Hora da Rejeição:</strong> {reject_str}</p>
-        <hr>
-        <p style="font-size: 0.9em; color: #888;">
-          Esta é uma mensagem automática do sistema I
-          nternum - 1º SRI de Cascavel/PR.
-        </p>
-      </body>
-    </html>
-    """  # noqa: W291
+    invalidate_book_list_cache()
+
+    reject_str = loan_db.updated_at.astimezone(SP_TZ).strftime(_FMT_DT)
+
+    html_content = render_email(
+        LOAN_REJECT_EMAIL,
+        name=current_user.name,
+        title=book_row.title,
+        author=book_row.author,
+        when=reject_str,
+    )
 
     background_tasks.add_task(
         email_service.send_email,
@@ -654,33 +825,86 @@ async def reject_loan(
     return loan_db
 
 
+async def _page_loans(
+    session: AsyncSession,
+    stmt,
+    params: LoanQueryParams,
+    limit: int,
+    estimate_total: bool = False,
+):
+    """Ordena, pagina (offset ou cursor) e monta a resposta de empréstimos.
+
+    O cursor só vale para ``sort_by=created_at``: ``due_date`` é nulo nos
+    pedidos ainda não aprovados e não serve de chave.
+    """
+    sort_column = ALLOWED_SORT_FIELDS[params.sort_by]
+    descending = params.sort_order != 'asc'
+    sort_func = desc if descending else asc
+    stmt = stmt.order_by(sort_func(sort_column), sort_func(Loan.id))
+    keyset = params.sort_by == 'created_at'
+
+    if params.cursor:
+        if not keyset:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail='Cursor pagination requires sort_by=created_at.',
+            )
+        loans, has_next = await _fetch_probe(
+            session,
+            _after_cursor(
+                stmt,
+                (Loan.created_at, Loan.id),
+                _decode_cursor(params.cursor, datetime.fromisoformat),
+                descending=descending,
+            ),
+            limit,
+        )
+        meta = _cursor_meta(limit, has_next)
+    elif not params.include_total:
+        loans, has_next = await _fetch_probe(
+            session, stmt.offset(params.offset), limit
+        )
+        meta = _uncounted_meta(params.offset, limit, has_next)
+    else:
+        # Sem filtros, o total de uma tabela grande vem da estatística do
+        # Postgres (pg_class.reltuples) em vez de contar todas as linhas.
+        total = None
+        if estimate_total:
+            total = await _estimated_total(session, Loan.__tablename__)
+
+        if total is None:
+            loans, total = await _fetch_page(
+                session, stmt, params.offset, limit
+            )
+        else:
+            loans = (
+                await session.scalars(stmt.offset(params.offset).limit(limit))
+            ).all()
+        meta = _offset_meta(total, params.offset, limit)
+
+    if keyset and meta.has_next and loans:
+        meta.next_cursor = _encode_cursor(loans[-1].created_at, loans[-1].id)
+
+    await load_audit_users(session, loans, LOAN_USER_RELATIONS)
+
+    # O response_model valida as linhas uma única vez na saída.
+    return {'meta': meta, 'loans': loans}
+
+
 @router.get(
     '/loans',
     response_model=PaginatedLoansList,
     status_code=HTTPStatus.OK,
 )
 async def list_loans(
-    session: Session,
-    current_user: CurrentUser,
+    session: ReadSession,
+    current_user: VerifyAdminCoordRead,
     params: Annotated[LoanQueryParams, Depends()],
 ):
-    if current_user.id and current_user.role not in {
-        'admin',
-        'coord',
-    }:
-        raise HTTPException(
-            status_code=HTTPStatus.FORBIDDEN,
-            detail='Access forbidden. User role does not permit this action.',
-        )
-
-    stmt = select(Loan).options(
-        selectinload(Loan.book),
-        selectinload(Loan.created_by),
-        selectinload(Loan.approved_by),
-    )
+    limit = min(params.limit, MAX_PAGE_SIZE)
+    stmt = select(Loan)
 
     filters = []
-    joins = []
 
     if params.status:
         try:
@@ -694,8 +918,13 @@ async def list_loans(
 
     if params.search:
         search_pattern = f'%{params.search}%'
-        joins.append((Loan.book, Book))
-        joins.append((Loan.created_by, User))
+        # JOIN explícito (sem EXISTS correlacionado): os índices trigram de
+        # books e users atendem o ILIKE, e o livro já vem na mesma linha.
+        stmt = (
+            stmt.join(Loan.book)
+            .join(Loan.created_by)
+            .options(contains_eager(Loan.book))
+        )
 
         filters.append(
             or_(
@@ -706,45 +935,19 @@ async def list_loans(
             )
         )
 
-    for relationship, model in joins:
-        stmt = stmt.join(relationship)
+    else:
+        stmt = stmt.options(selectinload(Loan.book))
 
+    stmt = stmt.options(_NO_LAZY)
     if filters:
         stmt = stmt.where(*filters)
 
-    stmt = stmt.distinct()
-    count_stmt = select(func.count(func.distinct(Loan.id))).select_from(Loan)
-
-    for relationship, model in joins:
-        count_stmt = count_stmt.join(relationship)
-    if filters:
-        count_stmt = count_stmt.where(*filters)
-
-    total = (await session.scalar(count_stmt)) or 0
-
-    sort_field = params.sort_by
-    sort_column = ALLOWED_SORT_FIELDS[sort_field]
-    sort_func = asc if params.sort_order == 'asc' else desc
-    stmt = stmt.order_by(sort_func(sort_column))
-
-    stmt = stmt.offset(params.offset).limit(params.limit)
-    loans = (await session.scalars(stmt)).unique().all()
-
-    total_pages = (total + params.limit - 1) // params.limit
-    current_page = (params.offset // params.limit) + 1
-
-    meta = PageMeta(
-        total=total,
-        page=current_page,
-        size=params.limit,
-        total_pages=total_pages,
-        has_next=params.offset + params.limit < total,
-        has_prev=params.offset > 0,
-        offset=params.offset,
+    # Os joins são muitos-para-um (livro, autor): cada empréstimo aparece
+    # uma vez, sem DISTINCT, e a janela conta empréstimos.
+    return await _page_loans(
+        session, stmt, params, limit, estimate_total=not filters
     )
 
-    return PaginatedLoansList(meta=meta, loans=loans)
-
 
 @router.get(
     '/loans/my',
@@ -752,18 +955,15 @@ async def list_loans(
     status_code=HTTPStatus.OK,
 )
 async def list_my_loans(
-    session: Session,
-    current_user: CurrentUser,
+    session: ReadSession,
+    current_user: CurrentReadUser,
     params: Annotated[LoanQueryParams, Depends()],
 ):
+    limit = min(params.limit, MAX_PAGE_SIZE)
     stmt = (
         select(Loan)
         .where(Loan.created_by_id == current_user.id)
-        .options(
-            selectinload(Loan.book),
-            selectinload(Loan.created_by),
-            selectinload(Loan.approved_by),
-        )
+        .options(selectinload(Loan.book), _NO_LAZY)
     )
 
     if params.status:
@@ -776,34 +976,4 @@ async def list_my_loans(
                 detail=f"Invalid status '{params.status}'",
             )
 
-    count_stmt = (
-        select(func.count())
-        .select_from(Loan)
-        .where(Loan.created_by_id == current_user.id)
-    )
-    if params.status:
-        count_stmt = count_stmt.where(Loan.status == status_enum)
-    total = (await session.scalar(count_stmt)) or 0
-
-    sort_field = params.sort_by
-    sort_column = ALLOWED_SORT_FIELDS[sort_field]
-    sort_func = asc if params.sort_order == 'asc' else desc
-    stmt = stmt.order_by(sort_func(sort_column))
-
-    stmt = stmt.offset(params.offset).limit(params.limit)
-    loans = (await session.scalars(stmt)).unique().all()
-
-    total_pages = (total + params.limit - 1) // params.limit
-    current_page = (params.offset // params.limit) + 1
-
-    meta = PageMeta(
-        total=total,
-        page=current_page,
-        size=params.limit,
-        total_pages=total_pages,
-        has_next=params.offset + params.limit < total,
-        has_prev=params.offset > 0,
-        offset=params.offset,
-    )
-
-    return PaginatedLoansList(meta=meta, loans=loans)
+    return await _page_loans(session, stmt, params, limit)
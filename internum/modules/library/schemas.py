@@ -53,6 +53,14 @@ class LoanBriefSchema(BaseModel):
 class LoanQueryParams(BaseModel):
     limit: int = Query(default=10, ge=1, description='Itens por página')
     offset: int = Query(default=0, ge=0, description='Itens a pular')
+    cursor: Optional[str] = Query(
+        default=None,
+        description='Cursor da próxima página (ignora offset)',
+    )
+    include_total: bool = Query(
+        default=True,
+        description='Calcular total e total_pages (exige contagem)',
+    )
     status: Optional[str] = Query(
         default=None, description='Filtrar por status'
     )
@@ -73,14 +81,17 @@ class LoanQueryParams(BaseModel):
     )
 
 
+# Com cursor não há contagem nem posição: total, page, total_pages e
+# offset vêm nulos; com include_total=false, só total e total_pages.
 class PageMeta(BaseModel):
-    total: int
-    page: int
+    total: Optional[int]
+    page: Optional[int]
     size: int
-    total_pages: int
+    total_pages: Optional[int]
     has_next: bool
     has_prev: bool
-    offset: int
+    offset: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class PaginatedLoansList(BaseModel):
@@ -139,6 +150,14 @@ class BookQueryParams(BaseModel):
         default=10, ge=1, description='Número de itens por página'
     )
     offset: int = Query(default=0, ge=0, description='Número de itens a pular')
+    cursor: Optional[str] = Query(
+        default=None,
+        description='Cursor da próxima página (ignora offset)',
+    )
+    include_total: bool = Query(
+        default=True,
+        description='Calcular total e total_pages (exige contagem)',
+    )
 
     search: Optional[str] = Query(
         default=None,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, DateTime, func
+from sqlalchemy import Boolean, Date, DateTime, Index, extract, func
 from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -45,3 +45,15 @@ class User:
         nullable=True,
         init=False,
     )
+
+
+# Aniversariantes do mês são buscados por EXTRACT(month FROM birthday).
+Index('ix_users_birthday_month', extract('month', User.birthday))
+
+# Busca de empréstimos por nome do usuário (ILIKE '%termo%').
+Index(
+    'ix_users_name_trgm',
+    User.name,
+    postgresql_using='gin',
+    postgresql_ops={'name': 'gin_trgm_ops'},
+)
@@ -3,7 +3,7 @@ from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,7 +14,11 @@ from internum.core.permissions import (
     VerifySelfAdmin,
     VerifySelfAdminCoord,
 )
-from internum.core.security import get_password_hash, verify_password
+from internum.core.security import (
+    get_password_hash,
+    invalidate_user_cache,
+    verify_password,
+)
 from internum.modules.users.models import User
 from internum.modules.users.schemas import (
     Message,
@@ -57,12 +61,15 @@ async def create_user(
             )
 
     data = user.model_dump()
-    data['password'] = get_password_hash(data['password'])
+    data['password'] = await get_password_hash(data['password'])
+
     db_user = User(**data)
 
+    # O flush do ORM já traz id e created_at no RETURNING do INSERT (sem
+    # refresh) e, ao contrário de um insert() direto, dispara os eventos
+    # do mapper, como before_insert.
     session.add(db_user)
     await session.commit()
-    await session.refresh(db_user)
 
     return db_user
 
@@ -155,20 +162,11 @@ async def update_user(
     session: Session,
     current_user: VerifySelfAdminCoord,
 ):
-    db_user = await session.scalar(
-        select(User).where((User.id == user_id) & (User.active))
-    )
-
-    if not db_user:
-        raise HTTPException(
-            status_code=HTTPStatus.NOT_FOUND,
-            detail=f'Não encontrado usuário com id ({user_id}).',
-        )
-
     update_data = user_data.model_dump(exclude_unset=True)
+    changes = {}
 
     for field, value in update_data.items():
-        if value is not None and hasattr(db_user, field):
+        if value is not None:
             if field in {
                 'role',
                 'setor',
@@ -185,12 +183,26 @@ async def update_user(
                         'campos perfil, setor, subsetor e ativo'
                     ),
                 )
-            setattr(db_user, field, value)
+            changes[field] = value
+
+    user_filter = (User.id == user_id) & (User.active)
+
     try:
-        await session.commit()
-        await session.refresh(db_user)
+        if changes:
+            # O UPDATE devolve a linha gravada (com updated_at): sem refresh.
+            db_user = await session.scalar(
+                update(User)
+                .where(user_filter)
+                .values(**changes)
+                .returning(User)
+                .execution_options(populate_existing=True)
+            )
+        else:
+            db_user = await session.scalar(select(User).where(user_filter))
 
-        return db_user
+        if db_user:
+            await session.commit()
+            invalidate_user_cache(user_id)
 
     except IntegrityError:
         await session.rollback()
@@ -205,6 +217,14 @@ async def update_user(
             detail=f'Erro interno ao atualizar usuário. {(e)}',
         )
 
+    if not db_user:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f'Não encontrado usuário com id ({user_id}).',
+        )
+
+    return db_user
+
 
 @router.delete('/{user_id}', status_code=HTTPStatus.NO_CONTENT)
 async def deactivate_user(
@@ -228,6 +248,7 @@ async def deactivate_user(
 
     db_user.active = False
     await session.commit()
+    invalidate_user_cache(user_id)
 
 
 @router.post(
@@ -249,19 +270,20 @@ async def change_password(
             detail=f'Não encontrado usuário com id ({user_id}).',
         )
 
-    if not verify_password(passwords.old_password, db_user.password):
+    if not await verify_password(passwords.old_password, db_user.password):
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
             detail='Senha antiga incorreta.',
         )
 
-    if verify_password(passwords.new_password, db_user.password):
+    if await verify_password(passwords.new_password, db_user.password):
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
             detail='Senha nova igual à atual.',
         )
 
-    db_user.password = get_password_hash(passwords.new_password)
+    db_user.password = await get_password_hash(passwords.new_password)
     await session.commit()
+    invalidate_user_cache(user_id)
 
     return {'message': 'Senha alterada com sucesso'}
@@ -6,11 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from internum.core.database import get_session
 from internum.core.security import get_password_hash
-from internum.core.settings import Settings
+from internum.core.settings import get_settings
 from internum.modules.users.enums import Role, Setor
 from internum.modules.users.models import User
 
-settings = Settings()
+settings = get_settings()
 Session = Annotated[AsyncSession, Depends(get_session)]
 
 
@@ -20,7 +20,7 @@ async def create_admin(session: Session):
         username=settings.ADMIN_USERNAME,
         email=settings.ADMIN_EMAIL,
         birthday=settings.ADMIN_BIRTHDAY,
-        password=get_password_hash(settings.ADMIN_PASSWORD),
+        password=await get_password_hash(settings.ADMIN_PASSWORD),
         role=Role.ADMIN,
         setor=Setor.ADMINISTRATIVO,
         subsetor='Apoio',
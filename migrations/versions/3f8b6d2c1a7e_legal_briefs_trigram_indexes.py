@@ -0,0 +1,45 @@
+"""Legal briefs trigram indexes
+
+Revision ID: 3f8b6d2c1a7e
+Revises: 7c1e2a9d4b3f
+Create Date: 2026-10-16 14:03:27.552913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b6d2c1a7e'
+down_revision: Union[str, Sequence[str], None] = '7c1e2a9d4b3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    with op.get_context().autocommit_block():
+        for column in ('title', 'content'):
+            op.create_index(
+                f'ix_legal_briefs_{column}_trgm',
+                'legal_briefs',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for column in ('title', 'content'):
+            op.drop_index(
+                f'ix_legal_briefs_{column}_trgm',
+                table_name='legal_briefs',
+                postgresql_concurrently=True,
+            )
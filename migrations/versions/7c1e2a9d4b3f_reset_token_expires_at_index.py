@@ -0,0 +1,41 @@
+"""Reset token expires_at partial index
+
+Revision ID: 7c1e2a9d4b3f
+Revises: 504a0de55569
+Create Date: 2026-10-16 09:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e2a9d4b3f'
+down_revision: Union[str, Sequence[str], None] = '504a0de55569'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_password_reset_tokens_expires_at',
+            'password_reset_tokens',
+            ['expires_at'],
+            unique=False,
+            postgresql_where=sa.text('used = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_password_reset_tokens_expires_at',
+            table_name='password_reset_tokens',
+            postgresql_concurrently=True,
+        )
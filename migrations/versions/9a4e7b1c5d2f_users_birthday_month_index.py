@@ -0,0 +1,40 @@
+"""Users birthday month index
+
+Revision ID: 9a4e7b1c5d2f
+Revises: 3f8b6d2c1a7e
+Create Date: 2026-10-16 14:41:09.327615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4e7b1c5d2f'
+down_revision: Union[str, Sequence[str], None] = '3f8b6d2c1a7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_birthday_month',
+            'users',
+            [sa.text('EXTRACT(month FROM birthday)')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_birthday_month',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
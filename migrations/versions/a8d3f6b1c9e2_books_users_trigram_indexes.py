@@ -0,0 +1,52 @@
+"""Books and users trigram indexes
+
+Revision ID: a8d3f6b1c9e2
+Revises: f4a9c3e7b2d8
+Create Date: 2026-10-16 18:12:40.318264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d3f6b1c9e2'
+down_revision: Union[str, Sequence[str], None] = 'f4a9c3e7b2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_INDEXES = (
+    ('books', 'title'),
+    ('books', 'author'),
+    ('books', 'isbn'),
+    ('users', 'name'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    with op.get_context().autocommit_block():
+        for table, column in TRGM_INDEXES:
+            op.create_index(
+                f'ix_{table}_{column}_trgm',
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table, column in TRGM_INDEXES:
+            op.drop_index(
+                f'ix_{table}_{column}_trgm',
+                table_name=table,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,46 @@
+"""Keyset pagination indexes for books and loans
+
+Revision ID: b3e9d2f7a4c1
+Revises: a8d3f6b1c9e2
+Create Date: 2026-10-16 19:05:13.774120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e9d2f7a4c1'
+down_revision: Union[str, Sequence[str], None] = 'a8d3f6b1c9e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+KEYSET_INDEXES = (
+    ('ix_books_title_id', 'books', ['title', 'id']),
+    ('ix_loans_created_at_id', 'loans', ['created_at', 'id']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in KEYSET_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in KEYSET_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+            )
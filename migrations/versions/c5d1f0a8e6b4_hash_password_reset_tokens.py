@@ -0,0 +1,43 @@
+"""Store password reset tokens as SHA-256 digests
+
+Revision ID: c5d1f0a8e6b4
+Revises: 9a4e7b1c5d2f
+Create Date: 2026-10-16 15:20:48.904172
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d1f0a8e6b4'
+down_revision: Union[str, Sequence[str], None] = '9a4e7b1c5d2f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tokens em texto puro não têm como ser convertidos; são descartados
+    # (expiram em minutos, basta pedir um novo link).
+    op.execute(sa.text('DELETE FROM password_reset_tokens'))
+    op.alter_column(
+        'password_reset_tokens',
+        'token',
+        existing_type=sa.String(),
+        type_=sa.String(length=64),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'password_reset_tokens',
+        'token',
+        existing_type=sa.String(length=64),
+        type_=sa.String(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,66 @@
+"""Reset token cleanup indexes
+
+Revision ID: d6c2a8f4e1b9
+Revises: b3e9d2f7a4c1
+Create Date: 2026-10-16 21:34:08.402917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6c2a8f4e1b9'
+down_revision: Union[str, Sequence[str], None] = 'b3e9d2f7a4c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_password_reset_tokens_expires_at',
+            table_name='password_reset_tokens',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_password_reset_tokens_expires_at',
+            'password_reset_tokens',
+            ['expires_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_password_reset_tokens_used',
+            'password_reset_tokens',
+            ['expires_at'],
+            unique=False,
+            postgresql_where=sa.text('used IS TRUE'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_password_reset_tokens_used',
+            table_name='password_reset_tokens',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_password_reset_tokens_expires_at',
+            table_name='password_reset_tokens',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_password_reset_tokens_expires_at',
+            'password_reset_tokens',
+            ['expires_at'],
+            unique=False,
+            postgresql_where=sa.text('used = false'),
+            postgresql_concurrently=True,
+        )
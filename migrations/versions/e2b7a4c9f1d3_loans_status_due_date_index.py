@@ -0,0 +1,39 @@
+"""Loans status/due_date index
+
+Revision ID: e2b7a4c9f1d3
+Revises: c5d1f0a8e6b4
+Create Date: 2026-10-16 16:02:15.418330
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7a4c9f1d3'
+down_revision: Union[str, Sequence[str], None] = 'c5d1f0a8e6b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_loans_status_due_date',
+            'loans',
+            ['status', 'due_date'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_loans_status_due_date',
+            table_name='loans',
+            postgresql_concurrently=True,
+        )
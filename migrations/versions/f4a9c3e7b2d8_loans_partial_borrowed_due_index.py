@@ -0,0 +1,53 @@
+"""Replace loans status/due_date index with a partial index
+
+Revision ID: f4a9c3e7b2d8
+Revises: e2b7a4c9f1d3
+Create Date: 2026-10-16 16:48:52.206417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a9c3e7b2d8'
+down_revision: Union[str, Sequence[str], None] = 'e2b7a4c9f1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_loans_borrowed_due_date',
+            'loans',
+            ['due_date'],
+            unique=False,
+            postgresql_where=sa.text("status = 'BORROWED'"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_loans_status_due_date',
+            table_name='loans',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_loans_status_due_date',
+            'loans',
+            ['status', 'due_date'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_loans_borrowed_due_date',
+            table_name='loans',
+            postgresql_concurrently=True,
+        )
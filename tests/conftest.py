@@ -1,6 +1,6 @@
 from contextlib import contextmanager
-from datetime import date, datetime
-from unittest.mock import MagicMock
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
 
 import factory
 import pytest
@@ -8,12 +8,24 @@ import pytest_asyncio
 from fastapi.testclient import TestClient
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 from testcontainers.postgres import PostgresContainer
 
 from internum.app import app
-from internum.core.database import get_session
+from internum.core.database import (
+    get_read_session,
+    get_session,
+    make_read_session_maker,
+)
 from internum.core.models.registry import table_registry
-from internum.core.security import create_access_token, get_password_hash
+from internum.core.security import (
+    _user_cache,  # noqa: PLC2701
+    create_access_token,
+    get_password_hash,
+)
+from internum.modules.library.routers import (
+    _book_list_cache,  # noqa: PLC2701
+)
 from internum.modules.users.enums import Role, Setor
 from internum.modules.users.models import User
 
@@ -44,12 +56,22 @@ class UserFactory(factory.Factory):
 
 
 @pytest.fixture
-def client(session):
-    def get_session_override():
-        return session
+def client(session, engine):
+    async def get_session_override():
+        # Sessão própria por requisição: a conexão asyncpg é aberta e
+        # fechada no event loop do TestClient, nunca no loop do pytest.
+        async with AsyncSession(engine, expire_on_commit=False) as app_session:
+            yield app_session
+
+    read_session_maker = make_read_session_maker(engine)
+
+    async def get_read_session_override():
+        async with read_session_maker() as read_session:
+            yield read_session
 
     with TestClient(app) as client:
         app.dependency_overrides[get_session] = get_session_override
+        app.dependency_overrides[get_read_session] = get_read_session_override
         yield client
 
     app.dependency_overrides.clear()
@@ -57,8 +79,12 @@ def client(session):
 
 @pytest.fixture(scope='session')
 def engine():
-    with PostgresContainer('postgres:17', driver='psycopg') as postgres:
-        _engine = create_async_engine(postgres.get_connection_url())
+    with PostgresContainer('postgres:17', driver='asyncpg') as postgres:
+        # Sem pool: o TestClient roda em outro event loop, e uma conexão
+        # asyncpg não pode ser reaproveitada entre loops.
+        _engine = create_async_engine(
+            postgres.get_connection_url(), poolclass=NullPool
+        )
         yield _engine
 
 
@@ -120,7 +146,7 @@ def token_admin(client, user_admin):
 
 
 @contextmanager
-def _mock_db_time(*, model, time=datetime(2025, 5, 21)):
+def _mock_db_time(*, model, time=datetime(2025, 5, 21, tzinfo=timezone.utc)):
     def fake_time_hook(mapper, connection, target):
         if hasattr(target, 'created_at'):
             target.created_at = time
@@ -133,7 +159,7 @@ def _mock_db_time(*, model, time=datetime(2025, 5, 21)):
     yield time
 
     event.remove(model, 'before_insert', fake_time_hook)
-    event.listen(model, 'before_update', fake_time_hook)
+    event.remove(model, 'before_update', fake_time_hook)
 
 
 @pytest.fixture
@@ -146,7 +172,7 @@ async def user(session):
     user = UserFactory()
     plain_password = user.password
 
-    user.password = get_password_hash(plain_password)
+    user.password = await get_password_hash(plain_password)
 
     session.add(user)
     await session.commit()
@@ -161,7 +187,7 @@ async def user_inactive(session):
     user = UserFactory()
     plain_password = user.password
 
-    user.password = get_password_hash(plain_password)
+    user.password = await get_password_hash(plain_password)
     user.active = False
 
     session.add(user)
@@ -177,7 +203,7 @@ async def user_admin(session):
     user = UserFactory()
     plain_password = user.password
 
-    user.password = get_password_hash(plain_password)
+    user.password = await get_password_hash(plain_password)
     user.role = 'admin'
 
     session.add(user)
@@ -203,8 +229,22 @@ async def other_user(session):
 def mock_email_service(monkeypatch):
     from internum.core import email  # noqa: PLC0415
 
-    fake_send = MagicMock()
+    fake_send = AsyncMock()
 
     monkeypatch.setattr(email.EmailService, 'send_email', fake_send)
 
     return fake_send
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    _user_cache.clear()
+    yield
+    _user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_book_list_cache():
+    _book_list_cache.clear()
+    yield
+    _book_list_cache.clear()
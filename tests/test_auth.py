@@ -4,10 +4,11 @@ from http import HTTPStatus
 import pytest
 from freezegun import freeze_time
 
-from internum.core.settings import Settings
+from internum.core.security import hash_token
+from internum.core.settings import get_settings
 from internum.modules.auth.models import PasswordResetToken
 
-settings = Settings()
+settings = get_settings()
 
 ENDPOINT_URL = '/api/v1/auth'
 
@@ -153,7 +154,7 @@ async def test_reset_password_success(client, session, user, token_factory):
 
     db_reset_token = PasswordResetToken(
         user_id=user.id,
-        token=token_reset,
+        token=hash_token(token_reset),
         expires_at=datetime.now(UTC)
         + timedelta(minutes=settings.RESET_TOKEN_EXPIRE_MINUTES),
         used=False,
@@ -194,7 +195,7 @@ async def test_reset_password_wrong_purpose(
 
     db_reset_token = PasswordResetToken(
         user_id=user.id,
-        token=token,
+        token=hash_token(token),
         expires_at=datetime.now(UTC)
         + timedelta(minutes=settings.RESET_TOKEN_EXPIRE_MINUTES),
         used=False,
@@ -223,7 +224,7 @@ async def test_reset_password_expired_token(
 
         db_reset_token = PasswordResetToken(
             user_id=user.id,
-            token=token,
+            token=hash_token(token),
             expires_at=datetime.now(UTC)
             + timedelta(minutes=settings.RESET_TOKEN_EXPIRE_MINUTES),
             used=False,
@@ -250,7 +251,7 @@ async def test_reset_password_same_as_old(
 
     db_reset_token = PasswordResetToken(
         user_id=user.id,
-        token=token,
+        token=hash_token(token),
         expires_at=datetime.now(UTC)
         + timedelta(minutes=settings.RESET_TOKEN_EXPIRE_MINUTES),
         used=False,
@@ -281,7 +282,7 @@ async def test_reset_password_user_not_found(
 
     db_reset_token = PasswordResetToken(
         user_id=user.id,
-        token=token,
+        token=hash_token(token),
         expires_at=datetime.now(UTC)
         + timedelta(minutes=settings.RESET_TOKEN_EXPIRE_MINUTES),
         used=False,
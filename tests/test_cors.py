@@ -0,0 +1,49 @@
+from http import HTTPStatus
+
+from internum.core.settings import get_settings
+
+settings = get_settings()
+
+
+def test_cors_preflight_allowed_origin(client):
+    response = client.options(
+        '/api/v1/status',
+        headers={
+            'Origin': settings.FRONTEND_URL,
+            'Access-Control-Request-Method': 'GET',
+            'Access-Control-Request-Headers': 'authorization',
+        },
+    )
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert (
+        response.headers['access-control-allow-origin']
+        == settings.FRONTEND_URL
+    )
+    assert response.headers['access-control-allow-credentials'] == 'true'
+    assert response.headers['access-control-allow-headers'] == 'authorization'
+
+
+def test_cors_preflight_disallowed_origin(client):
+    response = client.options(
+        '/api/v1/status',
+        headers={
+            'Origin': 'https://evil.example.com',
+            'Access-Control-Request-Method': 'GET',
+        },
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert 'access-control-allow-origin' not in response.headers
+
+
+def test_cors_simple_request_adds_headers(client):
+    response = client.get(
+        '/api/v1/status', headers={'Origin': settings.FRONTEND_URL}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert (
+        response.headers['access-control-allow-origin']
+        == settings.FRONTEND_URL
+    )
@@ -0,0 +1,26 @@
+import pytest
+from sqlalchemy import text
+
+from internum.core.database import make_read_session_maker
+
+TXID_SQL = text('SELECT txid_current()')
+
+
+@pytest.mark.asyncio
+async def test_read_session_runs_without_transaction(engine):
+    read_session_maker = make_read_session_maker(engine)
+
+    # Em AUTOCOMMIT cada comando é a própria transação: ids distintos.
+    async with read_session_maker() as read_session:
+        first = await read_session.scalar(TXID_SQL)
+        second = await read_session.scalar(TXID_SQL)
+
+    assert first != second
+
+
+@pytest.mark.asyncio
+async def test_default_session_keeps_one_transaction(session):
+    first = await session.scalar(TXID_SQL)
+    second = await session.scalar(TXID_SQL)
+
+    assert first == second
@@ -0,0 +1,19 @@
+import pytest
+
+from internum.core import email
+
+
+@pytest.mark.asyncio
+async def test_email_client_is_recreated_after_close():
+    first = email._get_client()
+
+    await email.close_email_client()
+
+    assert first.is_closed
+    assert email._client is None
+
+    second = email._get_client()
+    assert second is not first
+    assert not second.is_closed
+
+    await email.close_email_client()
@@ -1,5 +1,8 @@
+from datetime import date
 from http import HTTPStatus
 
+from internum.modules.home.services import MONTHS_PT
+
 
 def test_get_home_summary_data(client, token):
     response = client.get(
@@ -8,3 +11,5 @@ def test_get_home_summary_data(client, token):
     )
 
     assert response.status_code == HTTPStatus.OK
+    current_month = MONTHS_PT[date.today().month - 1]
+    assert response.json()['current_month'] == current_month
@@ -1,19 +1,24 @@
 from datetime import UTC, datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from internum.modules.auth.jobs import (
-    _delete_expired_reset_tokens,  # noqa: PLC2701
-)
+from internum.modules.auth.jobs import delete_expired_reset_tokens
 from internum.modules.auth.models import PasswordResetToken
-from internum.modules.library.jobs import _mark_overdue_loans  # noqa: PLC2701
+from internum.modules.library import jobs as library_jobs
+from internum.modules.library.jobs import (
+    mark_overdue_loans,
+    send_alert_batch,
+    send_late_loan_alerts,
+)
 from internum.modules.library.models import Book, Loan, LoanStatus
 
 
 @pytest.mark.asyncio
 async def test_delete_expired_tokens(session, user):
-    expected_remain_tokens = 2
+    expected_remain_tokens = 1
 
     expired_token = PasswordResetToken(
         user_id=user.id,
@@ -39,18 +44,18 @@ async def test_delete_expired_tokens(session, user):
     session.add_all([expired_token, used_token, valid_token])
     await session.commit()
 
-    await _delete_expired_reset_tokens(session)
+    await delete_expired_reset_tokens(session)
 
     remaining_tokens = await session.scalars(select(PasswordResetToken))
     remaining_tokens_list = remaining_tokens.all()
 
     assert len(remaining_tokens_list) == expected_remain_tokens
-    assert remaining_tokens_list[0].token in {'valid_token', 'used_token'}
+    assert remaining_tokens_list[0].token == 'valid_token'
 
 
 @pytest.mark.asyncio
 async def test_delete_expired_tokens_no_tokens_to_delete(session):
-    await _delete_expired_reset_tokens(session)
+    await delete_expired_reset_tokens(session)
 
     remaining_tokens = await session.scalars(select(PasswordResetToken))
     assert len(remaining_tokens.all()) == 0
@@ -68,7 +73,7 @@ async def test_delete_expired_tokens_only_expired(session, user):
     session.add(expired_token)
     await session.commit()
 
-    await _delete_expired_reset_tokens(session)
+    await delete_expired_reset_tokens(session)
 
     remaining_tokens = await session.scalars(select(PasswordResetToken))
     assert len(remaining_tokens.all()) == 0
@@ -86,10 +91,10 @@ async def test_delete_expired_tokens_only_used(session, user):
     session.add(used_token)
     await session.commit()
 
-    await _delete_expired_reset_tokens(session)
+    await delete_expired_reset_tokens(session)
 
     remaining_tokens = await session.scalars(select(PasswordResetToken))
-    assert len(remaining_tokens.all()) == 1
+    assert len(remaining_tokens.all()) == 0
 
 
 @pytest.mark.asyncio
@@ -125,7 +130,10 @@ async def test_check_overdue_loans_marks_overdue(
     await session.commit()
     await session.refresh(overdue_loan)
 
-    await _mark_overdue_loans(session)
+    late_loan_ids = await mark_overdue_loans(session)
+    await send_late_loan_alerts(
+        async_sessionmaker(session.bind, expire_on_commit=False), late_loan_ids
+    )
 
     await session.refresh(overdue_loan)
 
@@ -165,8 +173,54 @@ async def test_check_overdue_loans_ignores_not_due(
     await session.commit()
     await session.refresh(loan)
 
-    await _mark_overdue_loans(session)
+    late_loan_ids = await mark_overdue_loans(session)
+    await send_late_loan_alerts(
+        async_sessionmaker(session.bind, expire_on_commit=False), late_loan_ids
+    )
 
     await session.refresh(loan)
     assert loan.status == LoanStatus.BORROWED
     assert mock_email_service.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_send_late_loan_alerts_loads_one_batch_at_a_time(
+    session, mock_email_service, monkeypatch
+):
+    loan_ids = [1, 2, 3]
+    loaded_batches = []
+
+    async def fake_load(_session, batch_ids):
+        loaded_batches.append(list(batch_ids))
+        return []
+
+    monkeypatch.setattr(library_jobs, 'LATE_ALERT_BATCH_SIZE', 2)
+    monkeypatch.setattr(library_jobs, 'load_late_loans', fake_load)
+
+    await send_late_loan_alerts(
+        async_sessionmaker(session.bind, expire_on_commit=False), loan_ids
+    )
+
+    assert loaded_batches == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_send_alert_batch_continues_after_failure(
+    mock_email_service,
+):
+    expected_emails = 2
+
+    loans = [
+        SimpleNamespace(
+            id=loan_id,
+            due_date=datetime.now(timezone.utc),
+            book=SimpleNamespace(title='Book', author='Author'),
+            created_by=SimpleNamespace(name='User', email='u@example.com'),
+        )
+        for loan_id in range(1, expected_emails + 1)
+    ]
+    mock_email_service.side_effect = [RuntimeError('smtp down'), None]
+
+    await send_alert_batch(loans)
+
+    assert mock_email_service.call_count == expected_emails
@@ -64,6 +64,22 @@ def test_create_legal_brief_value_missing(client, user_admin, token_admin):
     assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
 
 
+def test_create_legal_brief_extra_field(client, user_admin, token_admin):
+    new_legal_brief = {
+        'title': 'Ementa teste',
+        'content': 'Conteúdo da ementa teste',
+        'canceled': True,
+    }
+
+    response = client.post(
+        ENDPOINT_URL,
+        headers={'Authorization': f'Bearer {token_admin}'},
+        json=new_legal_brief,
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
 def test_create_legal_brief_data_missing_field(
     client, user_admin, token_admin
 ):
@@ -101,6 +117,44 @@ async def test_list_legal_briefs(session, client, user, user_admin, token):
 
     assert response.status_code == HTTPStatus.OK
     assert response.json()['meta']['total'] == total
+    assert all(
+        'revisions' not in brief for brief in response.json()['legal_briefs']
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_legal_briefs_with_cursor(
+    session, client, user, user_admin, token
+):
+    total = 5
+    size = 2
+    second_page = 2
+
+    legal_briefs = LegalBriefFactory.create_batch(total)
+    for lb in legal_briefs:
+        lb.created_by_id = user_admin.id
+    session.add_all(legal_briefs)
+    await session.commit()
+
+    first = client.get(
+        ENDPOINT_URL + f'?limit={size}',
+        headers={'Authorization': f'Bearer {token}'},
+    ).json()
+    cursor = first['meta']['next_cursor']
+
+    response = client.get(
+        ENDPOINT_URL + f'?limit={size}&after_id={cursor}',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    meta = response.json()['meta']
+    assert meta['total'] == total
+    assert meta['offset'] == size
+    assert meta['page'] == second_page
+    assert all(
+        brief['id'] > cursor for brief in response.json()['legal_briefs']
+    )
 
 
 @pytest.mark.asyncio
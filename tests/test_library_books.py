@@ -2,7 +2,7 @@ from http import HTTPStatus
 
 import factory
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
 
 from internum.modules.library.models import Book
 
@@ -18,7 +18,7 @@ class BookFactory(factory.Factory):
     author = factory.Faker('name')
     publisher = factory.Faker('company')
     edition = factory.Faker('pyint', min_value=1, max_value=10)
-    year = factory.Faker('year')
+    year = factory.Faker('pyint', min_value=1900, max_value=2025)
     quantity = 1
     available_quantity = 1
 
@@ -125,6 +125,95 @@ async def test_list_books_default(
     assert len(data['books']) == expected_books
 
 
+@pytest.mark.asyncio
+async def test_list_books_cache_invalidated_on_create(
+    client, session, user_admin, token_admin
+):
+    book = BookFactory()
+    book.created_by_id = user_admin.id
+    session.add(book)
+    await session.commit()
+
+    headers = {'Authorization': f'Bearer {token_admin}'}
+    first = client.get(ENDPOINT_URL, headers=headers)
+    assert first.json()['meta']['total'] == 1
+
+    client.post(
+        ENDPOINT_URL,
+        json={
+            'isbn': '9780000000001',
+            'title': 'Refactoring',
+            'author': 'Martin Fowler',
+            'publisher': 'Addison-Wesley',
+            'edition': 2,
+            'year': 2018,
+        },
+        headers=headers,
+    )
+
+    expected_total = 2
+    second = client.get(ENDPOINT_URL, headers=headers)
+    assert second.json()['meta']['total'] == expected_total
+
+
+@pytest.mark.asyncio
+async def test_list_books_with_cursor(client, session, user_admin, token):
+    total = 5
+    size = 2
+    books_list = BookFactory.create_batch(total)
+    for book in books_list:
+        book.created_by_id = user_admin.id
+
+    session.add_all(books_list)
+    await session.commit()
+
+    headers = {'Authorization': f'Bearer {token}'}
+    first = client.get(ENDPOINT_URL + f'?limit={size}', headers=headers)
+    cursor = first.json()['meta']['next_cursor']
+
+    response = client.get(
+        ENDPOINT_URL + f'?limit={size}&cursor={cursor}', headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data['meta']['total'] is None
+    assert data['meta']['has_next'] is True
+    seen = {b['id'] for b in first.json()['books']}
+    assert seen.isdisjoint(b['id'] for b in data['books'])
+
+
+@pytest.mark.asyncio
+async def test_list_books_without_total(client, session, user_admin, token):
+    books_list = BookFactory.create_batch(3)
+    for book in books_list:
+        book.created_by_id = user_admin.id
+
+    session.add_all(books_list)
+    await session.commit()
+
+    response = client.get(
+        ENDPOINT_URL + '?limit=2&include_total=false',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    meta = response.json()['meta']
+    assert meta['total'] is None
+    assert meta['total_pages'] is None
+    assert meta['has_next'] is True
+
+
+@pytest.mark.asyncio
+async def test_list_books_invalid_cursor(client, token):
+    response = client.get(
+        ENDPOINT_URL + '?cursor=not-a-cursor',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
 @pytest.mark.asyncio
 async def test_list_books_with_search(client, session, user_admin, token):
     book_a = BookFactory(title='Python Tricks')
@@ -216,9 +305,9 @@ async def test_soft_delete_success(client, session, token_admin, user_admin):
 
     assert response.status_code == HTTPStatus.NO_CONTENT
 
-    refreshed = await session.scalar(select(Book).where(Book.id == book.id))
-    assert refreshed.deleted_at is not None
-    assert refreshed.deleted_by_id == user_admin.id
+    await session.refresh(book)
+    assert book.deleted_at is not None
+    assert book.deleted_by_id == user_admin.id
 
 
 def test_soft_delete_not_found(client, token_admin):
@@ -227,3 +316,22 @@ def test_soft_delete_not_found(client, token_admin):
         headers={'Authorization': f'Bearer {token_admin}'},
     )
     assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_list_books_uses_a_single_connection(client, engine, token):
+    # Sem pool, cada checkout é uma conexão nova.
+    checkouts = []
+
+    def count_checkout(*args):
+        checkouts.append(args)
+
+    event.listen(engine.sync_engine, 'checkout', count_checkout)
+    try:
+        response = client.get(
+            ENDPOINT_URL, headers={'Authorization': f'Bearer {token}'}
+        )
+    finally:
+        event.remove(engine.sync_engine, 'checkout', count_checkout)
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(checkouts) == 1
@@ -1,6 +1,4 @@
-from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
-from unittest.mock import patch
 
 import factory
 import pytest
@@ -19,7 +17,7 @@ class BookFactory(factory.Factory):
     author = factory.Faker('name')
     publisher = factory.Faker('company')
     edition = factory.Faker('pyint', min_value=1, max_value=10)
-    year = factory.Faker('year')
+    year = factory.Faker('pyint', min_value=1900, max_value=2025)
     quantity = 1
     available_quantity = 1
 
@@ -211,51 +209,6 @@ async def test_list_my_loans_success(session, client, user, user_admin, token):
     )
 
 
-def _dt(days):
-    return datetime.now(timezone.utc) + timedelta(days=days)
-
-
-def test_check_overdue_updates_status(user_admin):
-    loan = Loan(book_id=1)
-    loan.created_by_id = user_admin.id
-    loan.status = LoanStatus.BORROWED
-    loan.borrowed_at = _dt(-10)
-    loan.due_date = _dt(-2)
-
-    loan.check_overdue()
-
-    assert loan.status == LoanStatus.LATE
-
-
-def test_check_overdue_ignores_not_due(user_admin):
-    loan = Loan(book_id=1)
-    loan.created_by_id = user_admin.id
-    loan.status = LoanStatus.BORROWED
-    loan.borrowed_at = _dt(-2)
-    loan.due_date = _dt(+5)
-
-    loan.check_overdue()
-
-    assert loan.status == LoanStatus.BORROWED
-
-
-def test_check_overdue_ignores_non_borrowed(user_admin):
-    for invalid in [
-        LoanStatus.REQUESTED,
-        LoanStatus.REJECTED,
-        LoanStatus.CANCELED,
-        LoanStatus.RETURNED,
-        LoanStatus.LATE,
-    ]:
-        loan = Loan(book_id=1, status=invalid)
-        loan.created_by_id = user_admin.id
-
-        loan.check_overdue()
-
-        assert loan.status == invalid
-        assert loan.due_date is None
-
-
 @pytest.mark.asyncio
 async def test_user_cannot_approve(session, client, token, user_admin):
     book = BookFactory()
@@ -309,10 +262,7 @@ def test_user_cannot_list_all(session, client, token):
     )
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
-    assert (
-        resp.json()['detail']
-        == 'Access forbidden. User role does not permit this action.'
-    )
+    assert resp.json()['detail'] == 'Acesso negado: usuário sem permissão'
 
 
 @pytest.mark.asyncio
@@ -523,7 +473,7 @@ async def test_return_loan_forbidden_for_other_user(
 
 
 @pytest.mark.asyncio
-async def test_return_loan_mark_as_returned_raises_400(
+async def test_return_loan_already_returned_raises_400(
     session, client, user, user_admin, token
 ):
     book = Book(
@@ -534,29 +484,29 @@ async def test_return_loan_mark_as_returned_raises_400(
         edition=1,
         year=2020,
         quantity=1,
-        available_quantity=0,
+        available_quantity=1,
     )
     book.created_by_id = user_admin.id
     session.add(book)
     await session.commit()
     await session.refresh(book)
 
-    loan = Loan(book_id=book.id, status=LoanStatus.BORROWED)
+    loan = Loan(book_id=book.id, status=LoanStatus.RETURNED)
     loan.created_by_id = user.id
     session.add(loan)
     await session.commit()
     await session.refresh(loan)
 
-    with patch.object(
-        Loan, 'mark_as_returned', side_effect=ValueError('invalid')
-    ):
-        resp = client.patch(
-            f'{ENDPOINT_URL}/{loan.id}/return',
-            headers={'Authorization': f'Bearer {token}'},
-        )
+    resp = client.patch(
+        f'{ENDPOINT_URL}/{loan.id}/return',
+        headers={'Authorization': f'Bearer {token}'},
+    )
 
     assert resp.status_code == HTTPStatus.BAD_REQUEST
-    assert 'invalid' in resp.json()['detail']
+    assert resp.json()['detail'] == 'Loan is not currently borrowed.'
+
+    await session.refresh(book)
+    assert book.available_quantity == book.quantity
 
 
 @pytest.mark.asyncio
@@ -396,8 +396,8 @@ async def test_deactivate_notice_success(
 
     assert response.status_code == HTTPStatus.NO_CONTENT
 
-    db_notice = await session.get(Notice, notice.id)
-    assert db_notice.active is False
+    await session.refresh(notice)
+    assert notice.active is False
 
 
 @pytest.mark.asyncio
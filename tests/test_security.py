@@ -2,10 +2,14 @@ from http import HTTPStatus
 
 from jwt import decode
 
-from internum.core.security import create_access_token
-from internum.core.settings import Settings
+from internum.core.security import (
+    _user_cache,  # noqa: PLC2701
+    create_access_token,
+    invalidate_user_cache,
+)
+from internum.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 ENDPOINT_URL = '/api/v1'
 
@@ -32,3 +36,18 @@ def test_jwt_invalid_token(client):
     assert response.json() == {
         'detail': 'Não foi possível validar as credenciais'
     }
+
+
+def test_current_user_cached_by_token(client, user, token):
+    headers = {'Authorization': f'Bearer {token}'}
+
+    response = client.get(f'{ENDPOINT_URL}/users/me', headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert token in _user_cache
+
+    response = client.get(f'{ENDPOINT_URL}/users/me', headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['id'] == user.id
+
+    invalidate_user_cache(user.id)
+    assert token not in _user_cache
@@ -6,3 +6,11 @@ def test_status_deve_retornar_ok(client):
 
     assert response.status_code == HTTPStatus.OK
     assert response.json()['status'] == 'ok'
+
+
+def test_status_deep_deve_retornar_ok(client):
+    response = client.get('/api/v1/status/deep')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['status'] == 'ok'
+    assert response.json()['current_db']